@@ -4,16 +4,19 @@ Example PyForge Mod - Invert Filter
 
 This Python file will be transpiled to C++ by PyForge.
 Place in mods/ directory and it will be auto-compiled.
+
+frame.buffer is the raw pixel buffer (uint8). XOR with 0xFF equals
+255 - x for every byte, so PyForge emits one bulk vectorized pass
+instead of a per-pixel get_pixel/set_pixel loop.
 """
 
+import numpy as np
+
 from camforge import Filter, Frame
 
 class InvertFilter(Filter):
     """Inverts all pixel colors"""
     
     def process(self, frame: Frame) -> Frame:
-        for y in range(frame.height):
-            for x in range(frame.width):
-                r, g, b = frame.get_pixel(x, y)
-                frame.set_pixel(x, y, 255 - r, 255 - g, 255 - b)
+        frame.buffer ^= np.uint8(0xFF)
         return frame
@@ -10,90 +10,190 @@
  * - All tables are constexpr (stored in flash, not SRAM)
  * - Replaces runtime multiplication with table lookup
  * - Each LUT trades flash space for CPU cycles
+ * - ESP32-S3: sepia runs on the PIE vector unit (8 pixels/iteration)
  * 
  * MEMORY USAGE:
  * - Grayscale LUTs: 768 bytes (3 x 256)
+ * - Grayscale RGB565 LUTs: 2176 bytes (1024 + 64 x uint16)
  * - Sepia LUTs: 2304 bytes (9 x 256)
- * - Total: ~3KB flash
+ * - Total: ~5KB flash
  */
 
 #include <stdint.h>
 
+// ESP32-S3 PIE (128-bit SIMD) kernels - not available on other Xtensa cores
+#if defined(__XTENSA__) && defined(__has_include)
+    #if __has_include(<sdkconfig.h>)
+        #include <sdkconfig.h>
+    #endif
+#endif
+#if defined(__XTENSA__) && defined(CONFIG_IDF_TARGET_ESP32S3)
+    #define LUT_USE_PIE 1
+#else
+    #define LUT_USE_PIE 0
+#endif
+
 // Compiler optimization hints
 #ifndef IRAM_ATTR
     #define IRAM_ATTR __attribute__((section(".iram1")))
 #endif
 #define FORCEINLINE __inline__ __attribute__((always_inline))
+#define LUT_HOT __attribute__((hot))
+
+// Guaranteed alignment (bytes) of pixel buffers passed to the filters.
+// Define as 16 when frame buffers come from 16-byte aligned allocations;
+// the compiler then drops the runtime alignment checks.
+#ifndef LUT_PIXEL_ALIGN
+    #define LUT_PIXEL_ALIGN 2
+#endif
 
 namespace lut {
 
 
 // GRAY_LUT_R: 256 entries, uint8_t
 // HARDWARE: Stored in flash (constexpr) to save SRAM
-static constexpr uint8_t GRAY_LUT_R[256] = {
-      0,   0,   0,   0,   1,   1,   1,   2,   2,   2,   3,   3,   3,   3,   4,   4,
-      4,   5,   5,   5,   6,   6,   6,   6,   7,   7,   7,   8,   8,   8,   9,   9,
-      9,   9,  10,  10,  10,  11,  11,  11,  12,  12,  12,  12,  13,  13,  13,  14,
-     14,  14,  15,  15,  15,  15,  16,  16,  16,  17,  17,  17,  18,  18,  18,  18,
-     19,  19,  19,  20,  20,  20,  21,  21,  21,  21,  22,  22,  22,  23,  23,  23,
-     24,  24,  24,  24,  25,  25,  25,  26,  26,  26,  27,  27,  27,  27,  28,  28,
-     28,  29,  29,  29,  30,  30,  30,  30,  31,  31,  31,  32,  32,  32,  33,  33,
-     33,  33,  34,  34,  34,  35,  35,  35,  36,  36,  36,  36,  37,  37,  37,  38,
-     38,  38,  39,  39,  39,  40,  40,  40,  40,  41,  41,  41,  42,  42,  42,  43,
-     43,  43,  43,  44,  44,  44,  45,  45,  45,  46,  46,  46,  46,  47,  47,  47,
-     48,  48,  48,  49,  49,  49,  49,  50,  50,  50,  51,  51,  51,  52,  52,  52,
-     52,  53,  53,  53,  54,  54,  54,  55,  55,  55,  55,  56,  56,  56,  57,  57,
-     57,  58,  58,  58,  58,  59,  59,  59,  60,  60,  60,  61,  61,  61,  61,  62,
-     62,  62,  63,  63,  63,  64,  64,  64,  64,  65,  65,  65,  66,  66,  66,  67,
-     67,  67,  67,  68,  68,  68,  69,  69,  69,  70,  70,  70,  70,  71,  71,  71,
-     72,  72,  72,  73,  73,  73,  73,  74,  74,  74,  75,  75,  75,  76,  76,  76
+alignas(32) static constexpr uint8_t GRAY_LUT_R[256] = {
+      0,   0,   0,   0,   1,   1,   1,   2,   2,   2,   2,   3,   3,   3,   4,   4,
+      4,   5,   5,   5,   5,   6,   6,   6,   7,   7,   7,   8,   8,   8,   8,   9,
+      9,   9,  10,  10,  10,  11,  11,  11,  11,  12,  12,  12,  13,  13,  13,  14,
+     14,  14,  14,  15,  15,  15,  16,  16,  16,  17,  17,  17,  17,  18,  18,  18,
+     19,  19,  19,  20,  20,  20,  20,  21,  21,  21,  22,  22,  22,  23,  23,  23,
+     23,  24,  24,  24,  25,  25,  25,  26,  26,  26,  26,  27,  27,  27,  28,  28,
+     28,  29,  29,  29,  29,  30,  30,  30,  31,  31,  31,  31,  32,  32,  32,  33,
+     33,  33,  34,  34,  34,  34,  35,  35,  35,  36,  36,  36,  37,  37,  37,  37,
+     38,  38,  38,  39,  39,  39,  40,  40,  40,  40,  41,  41,  41,  42,  42,  42,
+     43,  43,  43,  43,  44,  44,  44,  45,  45,  45,  46,  46,  46,  46,  47,  47,
+     47,  48,  48,  48,  49,  49,  49,  49,  50,  50,  50,  51,  51,  51,  52,  52,
+     52,  52,  53,  53,  53,  54,  54,  54,  55,  55,  55,  55,  56,  56,  56,  57,
+     57,  57,  58,  58,  58,  58,  59,  59,  59,  60,  60,  60,  60,  61,  61,  61,
+     62,  62,  62,  63,  63,  63,  63,  64,  64,  64,  65,  65,  65,  66,  66,  66,
+     66,  67,  67,  67,  68,  68,  68,  69,  69,  69,  69,  70,  70,  70,  71,  71,
+     71,  72,  72,  72,  72,  73,  73,  73,  74,  74,  74,  75,  75,  75,  75,  76
 };
 
 // GRAY_LUT_G: 256 entries, uint8_t
 // HARDWARE: Stored in flash (constexpr) to save SRAM
-static constexpr uint8_t GRAY_LUT_G[256] = {
+alignas(32) static constexpr uint8_t GRAY_LUT_G[256] = {
       0,   0,   1,   1,   2,   2,   3,   4,   4,   5,   5,   6,   7,   7,   8,   8,
-      9,   9,  10,  11,  11,  12,  12,  13,  14,  14,  15,  15,  16,  16,  17,  18,
-     18,  19,  19,  20,  21,  21,  22,  22,  23,  24,  24,  25,  25,  26,  26,  27,
-     28,  28,  29,  29,  30,  31,  31,  32,  32,  33,  33,  34,  35,  35,  36,  36,
-     37,  38,  38,  39,  39,  40,  41,  41,  42,  42,  43,  43,  44,  45,  45,  46,
-     46,  47,  48,  48,  49,  49,  50,  50,  51,  52,  52,  53,  53,  54,  55,  55,
-     56,  56,  57,  58,  58,  59,  59,  60,  60,  61,  62,  62,  63,  63,  64,  65,
-     65,  66,  66,  67,  67,  68,  69,  69,  70,  70,  71,  72,  72,  73,  73,  74,
-     75,  75,  76,  76,  77,  77,  78,  79,  79,  80,  80,  81,  82,  82,  83,  83,
-     84,  84,  85,  86,  86,  87,  87,  88,  89,  89,  90,  90,  91,  91,  92,  93,
-     93,  94,  94,  95,  96,  96,  97,  97,  98,  99,  99, 100, 100, 101, 101, 102,
-    103, 103, 104, 104, 105, 106, 106, 107, 107, 108, 108, 109, 110, 110, 111, 111,
-    112, 113, 113, 114, 114, 115, 116, 116, 117, 117, 118, 118, 119, 120, 120, 121,
-    121, 122, 123, 123, 124, 124, 125, 125, 126, 127, 127, 128, 128, 129, 130, 130,
-    131, 131, 132, 133, 133, 134, 134, 135, 135, 136, 137, 137, 138, 138, 139, 140,
-    140, 141, 141, 142, 142, 143, 144, 144, 145, 145, 146, 147, 147, 148, 148, 149
+      9,   9,  10,  11,  11,  12,  12,  13,  14,  14,  15,  15,  16,  17,  17,  18,
+     18,  19,  19,  20,  21,  21,  22,  22,  23,  24,  24,  25,  25,  26,  27,  27,
+     28,  28,  29,  29,  30,  31,  31,  32,  32,  33,  34,  34,  35,  35,  36,  36,
+     37,  38,  38,  39,  39,  40,  41,  41,  42,  42,  43,  44,  44,  45,  45,  46,
+     46,  47,  48,  48,  49,  49,  50,  51,  51,  52,  52,  53,  54,  54,  55,  55,
+     56,  56,  57,  58,  58,  59,  59,  60,  61,  61,  62,  62,  63,  63,  64,  65,
+     65,  66,  66,  67,  68,  68,  69,  69,  70,  71,  71,  72,  72,  73,  73,  74,
+     75,  75,  76,  76,  77,  78,  78,  79,  79,  80,  81,  81,  82,  82,  83,  83,
+     84,  85,  85,  86,  86,  87,  88,  88,  89,  89,  90,  90,  91,  92,  92,  93,
+     93,  94,  95,  95,  96,  96,  97,  98,  98,  99,  99, 100, 100, 101, 102, 102,
+    103, 103, 104, 105, 105, 106, 106, 107, 108, 108, 109, 109, 110, 110, 111, 112,
+    112, 113, 113, 114, 115, 115, 116, 116, 117, 117, 118, 119, 119, 120, 120, 121,
+    122, 122, 123, 123, 124, 125, 125, 126, 126, 127, 127, 128, 129, 129, 130, 130,
+    131, 132, 132, 133, 133, 134, 135, 135, 136, 136, 137, 137, 138, 139, 139, 140,
+    140, 141, 142, 142, 143, 143, 144, 144, 145, 146, 146, 147, 147, 148, 149, 149
 };
 
 // GRAY_LUT_B: 256 entries, uint8_t
 // HARDWARE: Stored in flash (constexpr) to save SRAM
-static constexpr uint8_t GRAY_LUT_B[256] = {
+alignas(32) static constexpr uint8_t GRAY_LUT_B[256] = {
       0,   0,   0,   0,   0,   0,   0,   0,   0,   1,   1,   1,   1,   1,   1,   1,
       1,   1,   2,   2,   2,   2,   2,   2,   2,   2,   2,   3,   3,   3,   3,   3,
-      3,   3,   3,   3,   4,   4,   4,   4,   4,   4,   4,   4,   4,   5,   5,   5,
+      3,   3,   3,   3,   4,   4,   4,   4,   4,   4,   4,   4,   5,   5,   5,   5,
       5,   5,   5,   5,   5,   6,   6,   6,   6,   6,   6,   6,   6,   6,   7,   7,
-      7,   7,   7,   7,   7,   7,   7,   8,   8,   8,   8,   8,   8,   8,   8,   8,
-      9,   9,   9,   9,   9,   9,   9,   9,   9,  10,  10,  10,  10,  10,  10,  10,
-     10,  10,  11,  11,  11,  11,  11,  11,  11,  11,  12,  12,  12,  12,  12,  12,
-     12,  12,  12,  13,  13,  13,  13,  13,  13,  13,  13,  13,  14,  14,  14,  14,
-     14,  14,  14,  14,  14,  15,  15,  15,  15,  15,  15,  15,  15,  15,  16,  16,
-     16,  16,  16,  16,  16,  16,  16,  17,  17,  17,  17,  17,  17,  17,  17,  18,
-     18,  18,  18,  18,  18,  18,  18,  18,  19,  19,  19,  19,  19,  19,  19,  19,
-     19,  20,  20,  20,  20,  20,  20,  20,  20,  20,  21,  21,  21,  21,  21,  21,
-     21,  21,  21,  22,  22,  22,  22,  22,  22,  22,  22,  22,  23,  23,  23,  23,
-     23,  23,  23,  23,  24,  24,  24,  24,  24,  24,  24,  24,  24,  25,  25,  25,
-     25,  25,  25,  25,  25,  25,  26,  26,  26,  26,  26,  26,  26,  26,  26,  27,
-     27,  27,  27,  27,  27,  27,  27,  27,  28,  28,  28,  28,  28,  28,  28,  28
+      7,   7,   7,   7,   7,   7,   7,   8,   8,   8,   8,   8,   8,   8,   8,   9,
+      9,   9,   9,   9,   9,   9,   9,   9,  10,  10,  10,  10,  10,  10,  10,  10,
+     10,  11,  11,  11,  11,  11,  11,  11,  11,  11,  12,  12,  12,  12,  12,  12,
+     12,  12,  12,  13,  13,  13,  13,  13,  13,  13,  13,  14,  14,  14,  14,  14,
+     14,  14,  14,  14,  15,  15,  15,  15,  15,  15,  15,  15,  15,  16,  16,  16,
+     16,  16,  16,  16,  16,  16,  17,  17,  17,  17,  17,  17,  17,  17,  18,  18,
+     18,  18,  18,  18,  18,  18,  18,  19,  19,  19,  19,  19,  19,  19,  19,  19,
+     20,  20,  20,  20,  20,  20,  20,  20,  20,  21,  21,  21,  21,  21,  21,  21,
+     21,  22,  22,  22,  22,  22,  22,  22,  22,  22,  23,  23,  23,  23,  23,  23,
+     23,  23,  23,  24,  24,  24,  24,  24,  24,  24,  24,  24,  25,  25,  25,  25,
+     25,  25,  25,  25,  25,  26,  26,  26,  26,  26,  26,  26,  26,  27,  27,  27,
+     27,  27,  27,  27,  27,  27,  28,  28,  28,  28,  28,  28,  28,  28,  28,  29
+};
+
+// GRAY_RB_LUT: 1024 entries, uint16_t
+// HARDWARE: Stored in flash (constexpr) to save SRAM
+alignas(32) static constexpr uint16_t GRAY_RB_LUT[1024] = {
+    0x0000, 0x00E9, 0x01D3, 0x02BC, 0x03A6, 0x048F, 0x0579, 0x0662, 0x074C, 0x0835, 0x091F, 0x0A08, 0x0AF2, 0x0BDB, 0x0CC5, 0x0DAE,
+    0x0E98, 0x0F81, 0x106A, 0x1154, 0x123D, 0x1327, 0x1410, 0x14FA, 0x15E3, 0x16CD, 0x17B6, 0x18A0, 0x1989, 0x1A73, 0x1B5C, 0x1C46,
+    0x0264, 0x034E, 0x0437, 0x0521, 0x060A, 0x06F4, 0x07DD, 0x08C7, 0x09B0, 0x0A9A, 0x0B83, 0x0C6D, 0x0D56, 0x0E3F, 0x0F29, 0x1012,
+    0x10FC, 0x11E5, 0x12CF, 0x13B8, 0x14A2, 0x158B, 0x1675, 0x175E, 0x1848, 0x1931, 0x1A1B, 0x1B04, 0x1BED, 0x1CD7, 0x1DC0, 0x1EAA,
+    0x04C9, 0x05B2, 0x069C, 0x0785, 0x086F, 0x0958, 0x0A42, 0x0B2B, 0x0C14, 0x0CFE, 0x0DE7, 0x0ED1, 0x0FBA, 0x10A4, 0x118D, 0x1277,
+    0x1360, 0x144A, 0x1533, 0x161D, 0x1706, 0x17F0, 0x18D9, 0x19C2, 0x1AAC, 0x1B95, 0x1C7F, 0x1D68, 0x1E52, 0x1F3B, 0x2025, 0x210E,
+    0x072D, 0x0817, 0x0900, 0x09E9, 0x0AD3, 0x0BBC, 0x0CA6, 0x0D8F, 0x0E79, 0x0F62, 0x104C, 0x1135, 0x121F, 0x1308, 0x13F2, 0x14DB,
+    0x15C5, 0x16AE, 0x1797, 0x1881, 0x196A, 0x1A54, 0x1B3D, 0x1C27, 0x1D10, 0x1DFA, 0x1EE3, 0x1FCD, 0x20B6, 0x21A0, 0x2289, 0x2373,
+    0x0991, 0x0A7B, 0x0B64, 0x0C4E, 0x0D37, 0x0E21, 0x0F0A, 0x0FF4, 0x10DD, 0x11C7, 0x12B0, 0x139A, 0x1483, 0x156C, 0x1656, 0x173F,
+    0x1829, 0x1912, 0x19FC, 0x1AE5, 0x1BCF, 0x1CB8, 0x1DA2, 0x1E8B, 0x1F75, 0x205E, 0x2148, 0x2231, 0x231B, 0x2404, 0x24ED, 0x25D7,
+    0x0BF6, 0x0CDF, 0x0DC9, 0x0EB2, 0x0F9C, 0x1085, 0x116F, 0x1258, 0x1341, 0x142B, 0x1514, 0x15FE, 0x16E7, 0x17D1, 0x18BA, 0x19A4,
+    0x1A8D, 0x1B77, 0x1C60, 0x1D4A, 0x1E33, 0x1F1D, 0x2006, 0x20F0, 0x21D9, 0x22C2, 0x23AC, 0x2495, 0x257F, 0x2668, 0x2752, 0x283B,
+    0x0E5A, 0x0F44, 0x102D, 0x1116, 0x1200, 0x12E9, 0x13D3, 0x14BC, 0x15A6, 0x168F, 0x1779, 0x1862, 0x194C, 0x1A35, 0x1B1F, 0x1C08,
+    0x1CF2, 0x1DDB, 0x1EC5, 0x1FAE, 0x2097, 0x2181, 0x226A, 0x2354, 0x243D, 0x2527, 0x2610, 0x26FA, 0x27E3, 0x28CD, 0x29B6, 0x2AA0,
+    0x10BE, 0x11A8, 0x1291, 0x137B, 0x1464, 0x154E, 0x1637, 0x1721, 0x180A, 0x18F4, 0x19DD, 0x1AC7, 0x1BB0, 0x1C9A, 0x1D83, 0x1E6C,
+    0x1F56, 0x203F, 0x2129, 0x2212, 0x22FC, 0x23E5, 0x24CF, 0x25B8, 0x26A2, 0x278B, 0x2875, 0x295E, 0x2A48, 0x2B31, 0x2C1A, 0x2D04,
+    0x1323, 0x140C, 0x14F6, 0x15DF, 0x16C9, 0x17B2, 0x189C, 0x1985, 0x1A6F, 0x1B58, 0x1C41, 0x1D2B, 0x1E14, 0x1EFE, 0x1FE7, 0x20D1,
+    0x21BA, 0x22A4, 0x238D, 0x2477, 0x2560, 0x264A, 0x2733, 0x281D, 0x2906, 0x29EF, 0x2AD9, 0x2BC2, 0x2CAC, 0x2D95, 0x2E7F, 0x2F68,
+    0x1587, 0x1671, 0x175A, 0x1844, 0x192D, 0x1A16, 0x1B00, 0x1BE9, 0x1CD3, 0x1DBC, 0x1EA6, 0x1F8F, 0x2079, 0x2162, 0x224C, 0x2335,
+    0x241F, 0x2508, 0x25F2, 0x26DB, 0x27C4, 0x28AE, 0x2997, 0x2A81, 0x2B6A, 0x2C54, 0x2D3D, 0x2E27, 0x2F10, 0x2FFA, 0x30E3, 0x31CD,
+    0x17EB, 0x18D5, 0x19BE, 0x1AA8, 0x1B91, 0x1C7B, 0x1D64, 0x1E4E, 0x1F37, 0x2021, 0x210A, 0x21F4, 0x22DD, 0x23C7, 0x24B0, 0x2599,
+    0x2683, 0x276C, 0x2856, 0x293F, 0x2A29, 0x2B12, 0x2BFC, 0x2CE5, 0x2DCF, 0x2EB8, 0x2FA2, 0x308B, 0x3175, 0x325E, 0x3348, 0x3431,
+    0x1A50, 0x1B39, 0x1C23, 0x1D0C, 0x1DF6, 0x1EDF, 0x1FC9, 0x20B2, 0x219C, 0x2285, 0x236E, 0x2458, 0x2541, 0x262B, 0x2714, 0x27FE,
+    0x28E7, 0x29D1, 0x2ABA, 0x2BA4, 0x2C8D, 0x2D77, 0x2E60, 0x2F4A, 0x3033, 0x311D, 0x3206, 0x32EF, 0x33D9, 0x34C2, 0x35AC, 0x3695,
+    0x1CB4, 0x1D9E, 0x1E87, 0x1F71, 0x205A, 0x2143, 0x222D, 0x2316, 0x2400, 0x24E9, 0x25D3, 0x26BC, 0x27A6, 0x288F, 0x2979, 0x2A62,
+    0x2B4C, 0x2C35, 0x2D1F, 0x2E08, 0x2EF2, 0x2FDB, 0x30C4, 0x31AE, 0x3297, 0x3381, 0x346A, 0x3554, 0x363D, 0x3727, 0x3810, 0x38FA,
+    0x1F18, 0x2002, 0x20EB, 0x21D5, 0x22BE, 0x23A8, 0x2491, 0x257B, 0x2664, 0x274E, 0x2837, 0x2921, 0x2A0A, 0x2AF4, 0x2BDD, 0x2CC7,
+    0x2DB0, 0x2E99, 0x2F83, 0x306C, 0x3156, 0x323F, 0x3329, 0x3412, 0x34FC, 0x35E5, 0x36CF, 0x37B8, 0x38A2, 0x398B, 0x3A75, 0x3B5E,
+    0x217D, 0x2266, 0x2350, 0x2439, 0x2523, 0x260C, 0x26F6, 0x27DF, 0x28C9, 0x29B2, 0x2A9C, 0x2B85, 0x2C6E, 0x2D58, 0x2E41, 0x2F2B,
+    0x3014, 0x30FE, 0x31E7, 0x32D1, 0x33BA, 0x34A4, 0x358D, 0x3677, 0x3760, 0x384A, 0x3933, 0x3A1C, 0x3B06, 0x3BEF, 0x3CD9, 0x3DC2,
+    0x23E1, 0x24CB, 0x25B4, 0x269E, 0x2787, 0x2871, 0x295A, 0x2A43, 0x2B2D, 0x2C16, 0x2D00, 0x2DE9, 0x2ED3, 0x2FBC, 0x30A6, 0x318F,
+    0x3279, 0x3362, 0x344C, 0x3535, 0x361F, 0x3708, 0x37F1, 0x38DB, 0x39C4, 0x3AAE, 0x3B97, 0x3C81, 0x3D6A, 0x3E54, 0x3F3D, 0x4027,
+    0x2646, 0x272F, 0x2818, 0x2902, 0x29EB, 0x2AD5, 0x2BBE, 0x2CA8, 0x2D91, 0x2E7B, 0x2F64, 0x304E, 0x3137, 0x3221, 0x330A, 0x33F4,
+    0x34DD, 0x35C6, 0x36B0, 0x3799, 0x3883, 0x396C, 0x3A56, 0x3B3F, 0x3C29, 0x3D12, 0x3DFC, 0x3EE5, 0x3FCF, 0x40B8, 0x41A2, 0x428B,
+    0x28AA, 0x2993, 0x2A7D, 0x2B66, 0x2C50, 0x2D39, 0x2E23, 0x2F0C, 0x2FF6, 0x30DF, 0x31C9, 0x32B2, 0x339B, 0x3485, 0x356E, 0x3658,
+    0x3741, 0x382B, 0x3914, 0x39FE, 0x3AE7, 0x3BD1, 0x3CBA, 0x3DA4, 0x3E8D, 0x3F77, 0x4060, 0x414A, 0x4233, 0x431C, 0x4406, 0x44EF,
+    0x2B0E, 0x2BF8, 0x2CE1, 0x2DCB, 0x2EB4, 0x2F9E, 0x3087, 0x3170, 0x325A, 0x3343, 0x342D, 0x3516, 0x3600, 0x36E9, 0x37D3, 0x38BC,
+    0x39A6, 0x3A8F, 0x3B79, 0x3C62, 0x3D4C, 0x3E35, 0x3F1F, 0x4008, 0x40F1, 0x41DB, 0x42C4, 0x43AE, 0x4497, 0x4581, 0x466A, 0x4754,
+    0x2D73, 0x2E5C, 0x2F45, 0x302F, 0x3118, 0x3202, 0x32EB, 0x33D5, 0x34BE, 0x35A8, 0x3691, 0x377B, 0x3864, 0x394E, 0x3A37, 0x3B21,
+    0x3C0A, 0x3CF4, 0x3DDD, 0x3EC6, 0x3FB0, 0x4099, 0x4183, 0x426C, 0x4356, 0x443F, 0x4529, 0x4612, 0x46FC, 0x47E5, 0x48CF, 0x49B8,
+    0x2FD7, 0x30C0, 0x31AA, 0x3293, 0x337D, 0x3466, 0x3550, 0x3639, 0x3723, 0x380C, 0x38F6, 0x39DF, 0x3AC9, 0x3BB2, 0x3C9B, 0x3D85,
+    0x3E6E, 0x3F58, 0x4041, 0x412B, 0x4214, 0x42FE, 0x43E7, 0x44D1, 0x45BA, 0x46A4, 0x478D, 0x4877, 0x4960, 0x4A49, 0x4B33, 0x4C1C,
+    0x323B, 0x3325, 0x340E, 0x34F8, 0x35E1, 0x36CB, 0x37B4, 0x389E, 0x3987, 0x3A70, 0x3B5A, 0x3C43, 0x3D2D, 0x3E16, 0x3F00, 0x3FE9,
+    0x40D3, 0x41BC, 0x42A6, 0x438F, 0x4479, 0x4562, 0x464C, 0x4735, 0x481E, 0x4908, 0x49F1, 0x4ADB, 0x4BC4, 0x4CAE, 0x4D97, 0x4E81,
+    0x34A0, 0x3589, 0x3673, 0x375C, 0x3845, 0x392F, 0x3A18, 0x3B02, 0x3BEB, 0x3CD5, 0x3DBE, 0x3EA8, 0x3F91, 0x407B, 0x4164, 0x424E,
+    0x4337, 0x4421, 0x450A, 0x45F3, 0x46DD, 0x47C6, 0x48B0, 0x4999, 0x4A83, 0x4B6C, 0x4C56, 0x4D3F, 0x4E29, 0x4F12, 0x4FFC, 0x50E5,
+    0x3704, 0x37ED, 0x38D7, 0x39C0, 0x3AAA, 0x3B93, 0x3C7D, 0x3D66, 0x3E50, 0x3F39, 0x4023, 0x410C, 0x41F6, 0x42DF, 0x43C8, 0x44B2,
+    0x459B, 0x4685, 0x476E, 0x4858, 0x4941, 0x4A2B, 0x4B14, 0x4BFE, 0x4CE7, 0x4DD1, 0x4EBA, 0x4FA4, 0x508D, 0x5177, 0x5260, 0x5349,
+    0x3968, 0x3A52, 0x3B3B, 0x3C25, 0x3D0E, 0x3DF8, 0x3EE1, 0x3FCB, 0x40B4, 0x419D, 0x4287, 0x4370, 0x445A, 0x4543, 0x462D, 0x4716,
+    0x4800, 0x48E9, 0x49D3, 0x4ABC, 0x4BA6, 0x4C8F, 0x4D79, 0x4E62, 0x4F4C, 0x5035, 0x511E, 0x5208, 0x52F1, 0x53DB, 0x54C4, 0x55AE,
+    0x3BCD, 0x3CB6, 0x3DA0, 0x3E89, 0x3F72, 0x405C, 0x4145, 0x422F, 0x4318, 0x4402, 0x44EB, 0x45D5, 0x46BE, 0x47A8, 0x4891, 0x497B,
+    0x4A64, 0x4B4E, 0x4C37, 0x4D21, 0x4E0A, 0x4EF3, 0x4FDD, 0x50C6, 0x51B0, 0x5299, 0x5383, 0x546C, 0x5556, 0x563F, 0x5729, 0x5812,
+    0x3E31, 0x3F1A, 0x4004, 0x40ED, 0x41D7, 0x42C0, 0x43AA, 0x4493, 0x457D, 0x4666, 0x4750, 0x4839, 0x4923, 0x4A0C, 0x4AF6, 0x4BDF,
+    0x4CC8, 0x4DB2, 0x4E9B, 0x4F85, 0x506E, 0x5158, 0x5241, 0x532B, 0x5414, 0x54FE, 0x55E7, 0x56D1, 0x57BA, 0x58A4, 0x598D, 0x5A76,
+    0x4095, 0x417F, 0x4268, 0x4352, 0x443B, 0x4525, 0x460E, 0x46F8, 0x47E1, 0x48CB, 0x49B4, 0x4A9D, 0x4B87, 0x4C70, 0x4D5A, 0x4E43,
+    0x4F2D, 0x5016, 0x5100, 0x51E9, 0x52D3, 0x53BC, 0x54A6, 0x558F, 0x5679, 0x5762, 0x584B, 0x5935, 0x5A1E, 0x5B08, 0x5BF1, 0x5CDB,
+    0x42FA, 0x43E3, 0x44CD, 0x45B6, 0x46A0, 0x4789, 0x4872, 0x495C, 0x4A45, 0x4B2F, 0x4C18, 0x4D02, 0x4DEB, 0x4ED5, 0x4FBE, 0x50A8,
+    0x5191, 0x527B, 0x5364, 0x544E, 0x5537, 0x5620, 0x570A, 0x57F3, 0x58DD, 0x59C6, 0x5AB0, 0x5B99, 0x5C83, 0x5D6C, 0x5E56, 0x5F3F,
+    0x455E, 0x4647, 0x4731, 0x481A, 0x4904, 0x49ED, 0x4AD7, 0x4BC0, 0x4CAA, 0x4D93, 0x4E7D, 0x4F66, 0x5050, 0x5139, 0x5223, 0x530C,
+    0x53F5, 0x54DF, 0x55C8, 0x56B2, 0x579B, 0x5885, 0x596E, 0x5A58, 0x5B41, 0x5C2B, 0x5D14, 0x5DFE, 0x5EE7, 0x5FD1, 0x60BA, 0x61A4,
+    0x47C2, 0x48AC, 0x4995, 0x4A7F, 0x4B68, 0x4C52, 0x4D3B, 0x4E25, 0x4F0E, 0x4FF8, 0x50E1, 0x51CA, 0x52B4, 0x539D, 0x5487, 0x5570,
+    0x565A, 0x5743, 0x582D, 0x5916, 0x5A00, 0x5AE9, 0x5BD3, 0x5CBC, 0x5DA6, 0x5E8F, 0x5F79, 0x6062, 0x614B, 0x6235, 0x631E, 0x6408,
+    0x4A27, 0x4B10, 0x4BFA, 0x4CE3, 0x4DCD, 0x4EB6, 0x4F9F, 0x5089, 0x5172, 0x525C, 0x5345, 0x542F, 0x5518, 0x5602, 0x56EB, 0x57D5,
+    0x58BE, 0x59A8, 0x5A91, 0x5B7B, 0x5C64, 0x5D4E, 0x5E37, 0x5F20, 0x600A, 0x60F3, 0x61DD, 0x62C6, 0x63B0, 0x6499, 0x6583, 0x666C
+};
+
+// GRAY_G_LUT: 64 entries, uint16_t
+// HARDWARE: Stored in flash (constexpr) to save SRAM
+alignas(32) static constexpr uint16_t GRAY_G_LUT[64] = {
+    0x0000, 0x0259, 0x04B2, 0x070B, 0x0964, 0x0BBD, 0x0E17, 0x1070, 0x12C9, 0x1522, 0x177B, 0x19D4, 0x1C2D, 0x1E86, 0x20DF, 0x2338,
+    0x2592, 0x27EB, 0x2A44, 0x2C9D, 0x2EF6, 0x314F, 0x33A8, 0x3601, 0x385A, 0x3AB3, 0x3D0C, 0x3F66, 0x41BF, 0x4418, 0x4671, 0x48CA,
+    0x4B23, 0x4D7C, 0x4FD5, 0x522E, 0x5487, 0x56E0, 0x593A, 0x5B93, 0x5DEC, 0x6045, 0x629E, 0x64F7, 0x6750, 0x69A9, 0x6C02, 0x6E5B,
+    0x70B5, 0x730E, 0x7567, 0x77C0, 0x7A19, 0x7C72, 0x7ECB, 0x8124, 0x837D, 0x85D6, 0x882F, 0x8A89, 0x8CE2, 0x8F3B, 0x9194, 0x93ED
 };
 
 // SEPIA_LUT_RR: 256 entries, uint8_t
 // HARDWARE: Stored in flash (constexpr) to save SRAM
-static constexpr uint8_t SEPIA_LUT_RR[256] = {
+alignas(32) static constexpr uint8_t SEPIA_LUT_RR[256] = {
       0,   0,   0,   1,   1,   1,   2,   2,   3,   3,   3,   4,   4,   5,   5,   5,
       6,   6,   7,   7,   7,   8,   8,   8,   9,   9,  10,  10,  10,  11,  11,  12,
      12,  12,  13,  13,  14,  14,  14,  15,  15,  16,  16,  16,  17,  17,  17,  18,
@@ -114,7 +214,7 @@ static constexpr uint8_t SEPIA_LUT_RR[256] = {
 
 // SEPIA_LUT_RG: 256 entries, uint8_t
 // HARDWARE: Stored in flash (constexpr) to save SRAM
-static constexpr uint8_t SEPIA_LUT_RG[256] = {
+alignas(32) static constexpr uint8_t SEPIA_LUT_RG[256] = {
       0,   0,   1,   2,   3,   3,   4,   5,   6,   6,   7,   8,   9,   9,  10,  11,
      12,  13,  13,  14,  15,  16,  16,  17,  18,  19,  19,  20,  21,  22,  22,  23,
      24,  25,  26,  26,  27,  28,  29,  29,  30,  31,  32,  32,  33,  34,  35,  35,
@@ -135,7 +235,7 @@ static constexpr uint8_t SEPIA_LUT_RG[256] = {
 
 // SEPIA_LUT_RB: 256 entries, uint8_t
 // HARDWARE: Stored in flash (constexpr) to save SRAM
-static constexpr uint8_t SEPIA_LUT_RB[256] = {
+alignas(32) static constexpr uint8_t SEPIA_LUT_RB[256] = {
       0,   0,   0,   0,   0,   0,   1,   1,   1,   1,   1,   2,   2,   2,   2,   2,
       3,   3,   3,   3,   3,   3,   4,   4,   4,   4,   4,   5,   5,   5,   5,   5,
       6,   6,   6,   6,   6,   6,   7,   7,   7,   7,   7,   8,   8,   8,   8,   8,
@@ -156,7 +256,7 @@ static constexpr uint8_t SEPIA_LUT_RB[256] = {
 
 // SEPIA_LUT_GR: 256 entries, uint8_t
 // HARDWARE: Stored in flash (constexpr) to save SRAM
-static constexpr uint8_t SEPIA_LUT_GR[256] = {
+alignas(32) static constexpr uint8_t SEPIA_LUT_GR[256] = {
       0,   0,   0,   1,   1,   1,   2,   2,   2,   3,   3,   3,   4,   4,   4,   5,
       5,   5,   6,   6,   6,   7,   7,   7,   8,   8,   9,   9,   9,  10,  10,  10,
      11,  11,  11,  12,  12,  12,  13,  13,  13,  14,  14,  14,  15,  15,  15,  16,
@@ -177,7 +277,7 @@ static constexpr uint8_t SEPIA_LUT_GR[256] = {
 
 // SEPIA_LUT_GG: 256 entries, uint8_t
 // HARDWARE: Stored in flash (constexpr) to save SRAM
-static constexpr uint8_t SEPIA_LUT_GG[256] = {
+alignas(32) static constexpr uint8_t SEPIA_LUT_GG[256] = {
       0,   0,   1,   2,   2,   3,   4,   4,   5,   6,   6,   7,   8,   8,   9,  10,
      10,  11,  12,  12,  13,  14,  15,  15,  16,  17,  17,  18,  19,  19,  20,  21,
      21,  22,  23,  23,  24,  25,  25,  26,  27,  28,  28,  29,  30,  30,  31,  32,
@@ -198,7 +298,7 @@ static constexpr uint8_t SEPIA_LUT_GG[256] = {
 
 // SEPIA_LUT_GB: 256 entries, uint8_t
 // HARDWARE: Stored in flash (constexpr) to save SRAM
-static constexpr uint8_t SEPIA_LUT_GB[256] = {
+alignas(32) static constexpr uint8_t SEPIA_LUT_GB[256] = {
       0,   0,   0,   0,   0,   0,   1,   1,   1,   1,   1,   1,   2,   2,   2,   2,
       2,   2,   3,   3,   3,   3,   3,   3,   4,   4,   4,   4,   4,   4,   5,   5,
       5,   5,   5,   5,   6,   6,   6,   6,   6,   6,   7,   7,   7,   7,   7,   7,
@@ -219,7 +319,7 @@ static constexpr uint8_t SEPIA_LUT_GB[256] = {
 
 // SEPIA_LUT_BR: 256 entries, uint8_t
 // HARDWARE: Stored in flash (constexpr) to save SRAM
-static constexpr uint8_t SEPIA_LUT_BR[256] = {
+alignas(32) static constexpr uint8_t SEPIA_LUT_BR[256] = {
       0,   0,   0,   0,   1,   1,   1,   1,   2,   2,   2,   2,   3,   3,   3,   4,
       4,   4,   4,   5,   5,   5,   5,   6,   6,   6,   7,   7,   7,   7,   8,   8,
       8,   8,   9,   9,   9,   9,  10,  10,  10,  11,  11,  11,  11,  12,  12,  12,
@@ -240,7 +340,7 @@ static constexpr uint8_t SEPIA_LUT_BR[256] = {
 
 // SEPIA_LUT_BG: 256 entries, uint8_t
 // HARDWARE: Stored in flash (constexpr) to save SRAM
-static constexpr uint8_t SEPIA_LUT_BG[256] = {
+alignas(32) static constexpr uint8_t SEPIA_LUT_BG[256] = {
       0,   0,   1,   1,   2,   2,   3,   3,   4,   4,   5,   5,   6,   6,   7,   7,
       8,   9,   9,  10,  10,  11,  11,  12,  12,  13,  13,  14,  14,  15,  15,  16,
      17,  17,  18,  18,  19,  19,  20,  20,  21,  21,  22,  22,  23,  23,  24,  24,
@@ -261,7 +361,7 @@ static constexpr uint8_t SEPIA_LUT_BG[256] = {
 
 // SEPIA_LUT_BB: 256 entries, uint8_t
 // HARDWARE: Stored in flash (constexpr) to save SRAM
-static constexpr uint8_t SEPIA_LUT_BB[256] = {
+alignas(32) static constexpr uint8_t SEPIA_LUT_BB[256] = {
       0,   0,   0,   0,   0,   0,   0,   0,   1,   1,   1,   1,   1,   1,   1,   1,
       2,   2,   2,   2,   2,   2,   2,   2,   3,   3,   3,   3,   3,   3,   3,   3,
       4,   4,   4,   4,   4,   4,   4,   5,   5,   5,   5,   5,   5,   5,   5,   6,
@@ -282,7 +382,7 @@ static constexpr uint8_t SEPIA_LUT_BB[256] = {
 
 // GAMMA_LUT_22: 256 entries, uint8_t
 // HARDWARE: Stored in flash (constexpr) to save SRAM
-static constexpr uint8_t GAMMA_LUT_22[256] = {
+alignas(32) static constexpr uint8_t GAMMA_LUT_22[256] = {
       0,  21,  28,  34,  39,  43,  46,  50,  53,  56,  59,  61,  64,  66,  68,  70,
      72,  74,  76,  78,  80,  82,  84,  85,  87,  89,  90,  92,  93,  95,  96,  98,
      99, 101, 102, 103, 105, 106, 107, 109, 110, 111, 112, 114, 115, 116, 117, 118,
@@ -303,7 +403,7 @@ static constexpr uint8_t GAMMA_LUT_22[256] = {
 
 // GAMMA_LUT_INV: 256 entries, uint8_t
 // HARDWARE: Stored in flash (constexpr) to save SRAM
-static constexpr uint8_t GAMMA_LUT_INV[256] = {
+alignas(32) static constexpr uint8_t GAMMA_LUT_INV[256] = {
       0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   1,
       1,   1,   1,   1,   1,   1,   1,   1,   1,   2,   2,   2,   2,   2,   2,   2,
       3,   3,   3,   3,   3,   4,   4,   4,   4,   5,   5,   5,   5,   6,   6,   6,
@@ -322,22 +422,30 @@ static constexpr uint8_t GAMMA_LUT_INV[256] = {
     223, 225, 227, 229, 231, 234, 236, 238, 240, 242, 244, 246, 248, 251, 253, 255
 };
 
-// VIGNETTE_LUT: 128 entries, uint8_t
+// VIGNETTE_LUT: 256 entries, uint8_t
 // HARDWARE: Stored in flash (constexpr) to save SRAM
-static constexpr uint8_t VIGNETTE_LUT[128] = {
-    255, 232, 223, 216, 210, 205, 200, 195, 191, 187, 184, 180, 177, 174, 171, 168,
-    165, 162, 159, 157, 154, 152, 149, 147, 145, 142, 140, 138, 136, 134, 132, 130,
-    128, 126, 124, 122, 120, 118, 116, 114, 112, 111, 109, 107, 105, 104, 102, 100,
-     99,  97,  96,  94,  92,  91,  89,  88,  86,  85,  83,  82,  80,  79,  78,  76,
-     75,  73,  72,  71,  69,  68,  66,  65,  64,  62,  61,  60,  59,  57,  56,  55,
-     53,  52,  51,  50,  48,  47,  46,  45,  44,  42,  41,  40,  39,  38,  36,  35,
-     34,  33,  32,  31,  30,  28,  27,  26,  25,  24,  23,  22,  21,  20,  19,  18,
-     16,  15,  14,  13,  12,  11,  10,   9,   8,   7,   6,   5,   4,   3,   2,   1
+alignas(32) static constexpr uint8_t VIGNETTE_LUT[256] = {
+    255, 240, 233, 228, 224, 220, 216, 213, 210, 208, 205, 203, 200, 198, 196, 194,
+    192, 190, 188, 186, 184, 182, 181, 179, 177, 176, 174, 173, 171, 170, 168, 167,
+    165, 164, 163, 161, 160, 159, 157, 156, 155, 153, 152, 151, 150, 149, 147, 146,
+    145, 144, 143, 142, 141, 139, 138, 137, 136, 135, 134, 133, 132, 131, 130, 129,
+    128, 127, 126, 125, 124, 123, 122, 121, 120, 119, 118, 117, 117, 116, 115, 114,
+    113, 112, 111, 110, 109, 109, 108, 107, 106, 105, 104, 103, 103, 102, 101, 100,
+     99,  99,  98,  97,  96,  95,  95,  94,  93,  92,  91,  91,  90,  89,  88,  88,
+     87,  86,  85,  85,  84,  83,  82,  82,  81,  80,  79,  79,  78,  77,  77,  76,
+     75,  74,  74,  73,  72,  72,  71,  70,  70,  69,  68,  68,  67,  66,  66,  65,
+     64,  64,  63,  62,  62,  61,  60,  60,  59,  58,  58,  57,  56,  56,  55,  55,
+     54,  53,  53,  52,  51,  51,  50,  50,  49,  48,  48,  47,  46,  46,  45,  45,
+     44,  43,  43,  42,  42,  41,  40,  40,  39,  39,  38,  38,  37,  36,  36,  35,
+     35,  34,  34,  33,  32,  32,  31,  31,  30,  30,  29,  28,  28,  27,  27,  26,
+     26,  25,  25,  24,  23,  23,  22,  22,  21,  21,  20,  20,  19,  19,  18,  18,
+     17,  16,  16,  15,  15,  14,  14,  13,  13,  12,  12,  11,  11,  10,  10,   9,
+      9,   8,   8,   7,   7,   6,   6,   5,   5,   4,   4,   3,   3,   2,   1,   1
 };
 
 // RGB565_R_PACK: 256 entries, uint16_t
 // HARDWARE: Stored in flash (constexpr) to save SRAM
-static constexpr uint16_t RGB565_R_PACK[256] = {
+alignas(32) static constexpr uint16_t RGB565_R_PACK[256] = {
     0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0800, 0x0800, 0x0800, 0x0800, 0x0800, 0x0800, 0x0800, 0x0800,
     0x1000, 0x1000, 0x1000, 0x1000, 0x1000, 0x1000, 0x1000, 0x1000, 0x1800, 0x1800, 0x1800, 0x1800, 0x1800, 0x1800, 0x1800, 0x1800,
     0x2000, 0x2000, 0x2000, 0x2000, 0x2000, 0x2000, 0x2000, 0x2000, 0x2800, 0x2800, 0x2800, 0x2800, 0x2800, 0x2800, 0x2800, 0x2800,
@@ -358,7 +466,7 @@ static constexpr uint16_t RGB565_R_PACK[256] = {
 
 // RGB565_G_PACK: 256 entries, uint16_t
 // HARDWARE: Stored in flash (constexpr) to save SRAM
-static constexpr uint16_t RGB565_G_PACK[256] = {
+alignas(32) static constexpr uint16_t RGB565_G_PACK[256] = {
     0x0000, 0x0000, 0x0000, 0x0000, 0x0020, 0x0020, 0x0020, 0x0020, 0x0040, 0x0040, 0x0040, 0x0040, 0x0060, 0x0060, 0x0060, 0x0060,
     0x0080, 0x0080, 0x0080, 0x0080, 0x00A0, 0x00A0, 0x00A0, 0x00A0, 0x00C0, 0x00C0, 0x00C0, 0x00C0, 0x00E0, 0x00E0, 0x00E0, 0x00E0,
     0x0100, 0x0100, 0x0100, 0x0100, 0x0120, 0x0120, 0x0120, 0x0120, 0x0140, 0x0140, 0x0140, 0x0140, 0x0160, 0x0160, 0x0160, 0x0160,
@@ -379,7 +487,7 @@ static constexpr uint16_t RGB565_G_PACK[256] = {
 
 // RGB565_B_PACK: 256 entries, uint8_t
 // HARDWARE: Stored in flash (constexpr) to save SRAM
-static constexpr uint8_t RGB565_B_PACK[256] = {
+alignas(32) static constexpr uint8_t RGB565_B_PACK[256] = {
       0,   0,   0,   0,   0,   0,   0,   0,   1,   1,   1,   1,   1,   1,   1,   1,
       2,   2,   2,   2,   2,   2,   2,   2,   3,   3,   3,   3,   3,   3,   3,   3,
       4,   4,   4,   4,   4,   4,   4,   4,   5,   5,   5,   5,   5,   5,   5,   5,
@@ -399,69 +507,320 @@ static constexpr uint8_t RGB565_B_PACK[256] = {
 };
 
 
+/**
+ * @brief Pack an 8-bit gray level into an RGB565 pixel
+ */
+static FORCEINLINE uint32_t gray_to_565(uint8_t gray) {
+    return (gray & 0xF8) << 8 | (gray & 0xFC) << 3 | (gray >> 3);
+}
+
+/**
+ * @brief Grayscale level of one RGB565 pixel via the pre-combined LUTs
+ * HARDWARE: 1 shifted index + 2 loads + 1 add
+ */
+static FORCEINLINE uint8_t gray_565(uint32_t p) {
+    uint16_t idx = ((p >> 6) & 0x3E0) | (p & 0x1F);  // r5 << 5 | b5
+    return (GRAY_RB_LUT[idx] + GRAY_G_LUT[(p >> 5) & 0x3F]) >> 8;
+}
+
+// uint32_t view of the uint16_t pixel buffer; may_alias keeps the SWAR
+// accesses legal under strict aliasing (same L32I/S32I code)
+typedef uint32_t __attribute__((may_alias)) pixel_pair_t;
+
 /**
  * @brief SIMD-optimized grayscale filter using LUT
- * HARDWARE: Uses pre-computed LUT (no multiply), unrolled loop
+ * HARDWARE: Uses pre-combined RB/G LUTs (no multiply), unrolled loop.
+ *           SWAR: two pixels per 32-bit load/store.
  * 
  * @param pixels Pointer to RGB565 pixel data
- * @param count Number of pixels (should be multiple of 8)
+ * @param count Number of pixels
  */
-static FORCEINLINE void IRAM_ATTR filter_grayscale_lut(uint16_t* pixels, int count) {
-    const int aligned = count & ~7;  // Process 8 at a time
+static FORCEINLINE LUT_HOT void IRAM_ATTR filter_grayscale_lut(uint16_t* __restrict__ pixels, int count) {
+    pixels = (uint16_t*)__builtin_assume_aligned(pixels, LUT_PIXEL_ALIGN);
+    int i = 0;
+    
+    // Peel one pixel so the 32-bit accesses below are word-aligned
+    if (__builtin_expect(((uintptr_t)pixels & 3) && count > 0, 0)) {
+        pixels[0] = gray_to_565(gray_565(pixels[0]));
+        i = 1;
+    }
     
-    #pragma GCC unroll 8
-    for (int i = 0; i < aligned; i++) {
-        // Extract RGB from RGB565
-        uint8_t r = (pixels[i] >> 8) & 0xF8;
-        uint8_t g = (pixels[i] >> 3) & 0xFC;
-        uint8_t b = (pixels[i] << 3) & 0xF8;
+    pixel_pair_t* __restrict__ p32 = (pixel_pair_t*)__builtin_assume_aligned(pixels + i, 4);
+    const int pairs = (count - i) >> 1;
+    
+    #pragma GCC unroll 4
+    for (int j = 0; j < pairs; j++) {
+        uint32_t v = p32[j];
         
-        // LUT-based grayscale (3 memory reads, 2 adds, no multiply!)
-        uint8_t gray = GRAY_LUT_R[r] + GRAY_LUT_G[g] + GRAY_LUT_B[b];
+        // LUT-based grayscale (4 memory reads, 2 adds for two pixels)
+        uint8_t gray0 = gray_565(v);
+        uint8_t gray1 = gray_565(v >> 16);
         
-        // Pack back to RGB565
-        pixels[i] = (gray & 0xF8) << 8 | (gray & 0xFC) << 3 | (gray >> 3);
+        // Pack both pixels back with a single 32-bit store
+        p32[j] = gray_to_565(gray0) | gray_to_565(gray1) << 16;
     }
     
-    // Handle remainder (same logic, no unroll)
-    for (int i = aligned; i < count; i++) {
-        uint8_t r = (pixels[i] >> 8) & 0xF8;
-        uint8_t g = (pixels[i] >> 3) & 0xFC;
-        uint8_t b = (pixels[i] << 3) & 0xF8;
-        uint8_t gray = GRAY_LUT_R[r] + GRAY_LUT_G[g] + GRAY_LUT_B[b];
-        pixels[i] = (gray & 0xF8) << 8 | (gray & 0xFC) << 3 | (gray >> 3);
+    // Handle odd remainder
+    i += pairs << 1;
+    if (__builtin_expect(i < count, 0)) {
+        pixels[i] = gray_to_565(gray_565(pixels[i]));
     }
 }
 
 
+/**
+ * @brief Clamp to [0, 255] without branches
+ * HARDWARE: ESP32-S3 - MAX + MINU, 2 single-cycle ALU ops
+ */
+static FORCEINLINE int sat8(int v) {
+#if LUT_USE_PIE
+    int r;
+    __asm__ ("max  %0, %1, %2\n\t"
+             "minu %0, %0, %3"
+             : "=&a"(r) : "a"(v), "a"(0), "a"(255));
+    return r;
+#else
+    // v & ~(v >> 31) drops negatives; (255 - t) >> 31 is all ones above 255
+    int t = v & ~(v >> 31);
+    return (t | ((255 - t) >> 31)) & 0xFF;
+#endif
+}
+
+
+#if LUT_USE_PIE
+// Broadcast constants for filter_sepia_pie, in the order they are loaded
+alignas(16) static constexpr uint16_t SEPIA_PIE_CONST[16] = {
+    0x00F8, 0x00FC,                     // R/B and G unpack masks
+    100, 196,  48,                      // R' = RR*r + RG*g + RB*b (Q8)
+     89, 175,  43,                      // G'
+     69, 136,  33,                      // B'
+    0x00FF,                             // Saturation limit
+    0x00F8, 0x00FC, 0x001F,             // R, G, B repack masks
+    0x0000
+};
+
+/**
+ * @brief Sepia filter on the ESP32-S3 PIE vector unit
+ * HARDWARE: 8 pixels per iteration, 9 vector MULs + 6 saturating adds
+ * 
+ * @param pixels Pointer to RGB565 pixel data (16-byte aligned)
+ * @param count Number of pixels
+ * @return Number of pixels processed (multiple of 8, 0 if unaligned)
+ */
+static FORCEINLINE LUT_HOT int IRAM_ATTR filter_sepia_pie(uint16_t* __restrict__ pixels, int count) {
+    pixels = (uint16_t*)__builtin_assume_aligned(pixels, LUT_PIXEL_ALIGN);
+    
+    // EE.VLD.128 ignores the low address bits - leave unaligned data to scalar
+    // (folded away at compile time when LUT_PIXEL_ALIGN >= 16)
+    if (__builtin_expect((uintptr_t)pixels & 15, 0)) return 0;
+    
+    const int aligned = count & ~7;
+    uint16_t* p = pixels;
+    
+    for (int i = 0; i < aligned; i += 8) {
+        const uint16_t* k = SEPIA_PIE_CONST;
+        __asm__ __volatile__ (
+            "ee.vld.128.ip   q0, %[p], 0      \n"  // q0 = 8 pixels
+            
+            // Unpack: q1 = r8, q2 = g8, q3 = b8
+            "ssai            8                \n"
+            "ee.vsr.32       q1, q0           \n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \n"  // 0x00F8
+            "ee.andq         q1, q1, q7       \n"
+            "ssai            3                \n"
+            "ee.vsl.32       q3, q0           \n"
+            "ee.andq         q3, q3, q7       \n"
+            "ee.vsr.32       q2, q0           \n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \n"  // 0x00FC
+            "ee.andq         q2, q2, q7       \n"
+            
+            // Matrix multiply: (x * c) >> 8 per term
+            "ssai            8                \n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \n"  // RR
+            "ee.vmul.u16     q4, q1, q7       \n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \n"  // RG
+            "ee.vmul.u16     q5, q2, q7       \n"
+            "ee.vadds.s16    q4, q4, q5       \n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \n"  // RB
+            "ee.vmul.u16     q5, q3, q7       \n"
+            "ee.vadds.s16    q4, q4, q5       \n"  // q4 = tr
+            
+            "ee.vldbc.16.ip  q7, %[k], 2      \n"  // GR
+            "ee.vmul.u16     q5, q1, q7       \n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \n"  // GG
+            "ee.vmul.u16     q6, q2, q7       \n"
+            "ee.vadds.s16    q5, q5, q6       \n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \n"  // GB
+            "ee.vmul.u16     q6, q3, q7       \n"
+            "ee.vadds.s16    q5, q5, q6       \n"  // q5 = tg
+            
+            "ee.vldbc.16.ip  q7, %[k], 2      \n"  // BR
+            "ee.vmul.u16     q6, q1, q7       \n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \n"  // BG
+            "ee.vmul.u16     q0, q2, q7       \n"
+            "ee.vadds.s16    q6, q6, q0       \n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \n"  // BB
+            "ee.vmul.u16     q0, q3, q7       \n"
+            "ee.vadds.s16    q6, q6, q0       \n"  // q6 = tb
+            
+            // Saturate to 255
+            "ee.vldbc.16.ip  q7, %[k], 2      \n"  // 0x00FF
+            "ee.vmin.s16     q4, q4, q7       \n"
+            "ee.vmin.s16     q5, q5, q7       \n"
+            "ee.vmin.s16     q6, q6, q7       \n"
+            
+            // Repack: (r & 0xF8) << 8 | (g & 0xFC) << 3 | b >> 3
+            "ee.vldbc.16.ip  q7, %[k], 2      \n"  // 0x00F8
+            "ee.andq         q4, q4, q7       \n"
+            "ee.vsl.32       q4, q4           \n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \n"  // 0x00FC
+            "ee.andq         q5, q5, q7       \n"
+            "ssai            3                \n"
+            "ee.vsl.32       q5, q5           \n"
+            "ee.vsr.32       q6, q6           \n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \n"  // 0x001F
+            "ee.andq         q6, q6, q7       \n"
+            "ee.orq          q4, q4, q5       \n"
+            "ee.orq          q4, q4, q6       \n"
+            "ee.vst.128.ip   q4, %[p], 16     \n"
+            : [p] "+r" (p), [k] "+r" (k)
+            :
+            : "memory"
+        );
+    }
+    
+    return aligned;
+}
+#endif // LUT_USE_PIE
+
+
 /**
  * @brief SIMD-optimized sepia filter using LUT
- * HARDWARE: 9-way LUT lookup replaces 9 multiplications
+ * HARDWARE: 9-way LUT lookup replaces 9 multiplications.
+ *           On ESP32-S3 the bulk runs on the PIE kernel above and
+ *           this loop only handles the tail (or unaligned buffers).
  * 
  * @param pixels Pointer to RGB565 pixel data
  * @param count Number of pixels
  */
-static FORCEINLINE void IRAM_ATTR filter_sepia_lut(uint16_t* pixels, int count) {
-    #pragma GCC unroll 4
-    for (int i = 0; i < count; i++) {
-        // Extract RGB
-        uint8_t r = (pixels[i] >> 8) & 0xF8;
-        uint8_t g = (pixels[i] >> 3) & 0xFC;
-        uint8_t b = (pixels[i] << 3) & 0xF8;
+static FORCEINLINE LUT_HOT void IRAM_ATTR filter_sepia_lut(uint16_t* __restrict__ pixels, int count) {
+    pixels = (uint16_t*)__builtin_assume_aligned(pixels, LUT_PIXEL_ALIGN);
+    int i = 0;
+#if LUT_USE_PIE
+    // Fewer than 8 pixels never reach the vector kernel
+    if (__builtin_expect(count >= 8, 1)) {
+        i = filter_sepia_pie(pixels, count);
+    }
+#endif
+    
+    if (i >= count) return;
+    
+    // 2-way software pipeline (the interleaved load/MAC scheme of CMSIS-DSP
+    // arm_mat_mult_fast_q15): the 9 LUT reads for pixel i+1 are issued
+    // before pixel i is saturated and stored, hiding load-use latency.
+    
+    // Prologue: matrix multiply via LUT lookups (9 reads + 6 adds vs 9 muls)
+    int r = (pixels[i] >> 8) & 0xF8;
+    int g = (pixels[i] >> 3) & 0xFC;
+    int b = (pixels[i] << 3) & 0xF8;
+    int tr = SEPIA_LUT_RR[r] + SEPIA_LUT_RG[g] + SEPIA_LUT_RB[b];
+    int tg = SEPIA_LUT_GR[r] + SEPIA_LUT_GG[g] + SEPIA_LUT_GB[b];
+    int tb = SEPIA_LUT_BR[r] + SEPIA_LUT_BG[g] + SEPIA_LUT_BB[b];
+    
+    for (; i < count - 1; i++) {
+        // Frame buffers may sit in PSRAM; the 2.3KB of LUTs stay cached
+        __builtin_prefetch(&pixels[i + 16], 1, 1);
         
-        // Matrix multiply via LUT lookups (9 reads + 6 adds vs 9 muls)
-        int tr = SEPIA_LUT_RR[r] + SEPIA_LUT_RG[g] + SEPIA_LUT_RB[b];
-        int tg = SEPIA_LUT_GR[r] + SEPIA_LUT_GG[g] + SEPIA_LUT_GB[b];
-        int tb = SEPIA_LUT_BR[r] + SEPIA_LUT_BG[g] + SEPIA_LUT_BB[b];
+        // Stage 1: extract pixel i+1 and issue its LUT reads
+        int rn = (pixels[i + 1] >> 8) & 0xF8;
+        int gn = (pixels[i + 1] >> 3) & 0xFC;
+        int bn = (pixels[i + 1] << 3) & 0xF8;
+        int trn = SEPIA_LUT_RR[rn] + SEPIA_LUT_RG[gn] + SEPIA_LUT_RB[bn];
+        int tgn = SEPIA_LUT_GR[rn] + SEPIA_LUT_GG[gn] + SEPIA_LUT_GB[bn];
+        int tbn = SEPIA_LUT_BR[rn] + SEPIA_LUT_BG[gn] + SEPIA_LUT_BB[bn];
         
-        // Saturate to 255
-        r = tr > 255 ? 255 : tr;
-        g = tg > 255 ? 255 : tg;
-        b = tb > 255 ? 255 : tb;
+        // Stage 2: saturate (branchless) and pack pixel i
+        pixels[i] = (sat8(tr) & 0xF8) << 8 | (sat8(tg) & 0xFC) << 3 | (sat8(tb) >> 3);
         
-        // Pack back
-        pixels[i] = (r & 0xF8) << 8 | (g & 0xFC) << 3 | (b >> 3);
+        tr = trn;
+        tg = tgn;
+        tb = tbn;
+    }
+    
+    // Epilogue: last pixel
+    pixels[i] = (sat8(tr) & 0xF8) << 8 | (sat8(tg) & 0xFC) << 3 | (sat8(tb) >> 3);
+}
+
+
+// Q15 polynomial coefficients c0..c4, t in [0, 1) (fitted by convert.py)
+static constexpr int32_t GAMMA_LOG2_POLY[5] = {7, 47059, -21939, 10232, -2593};  // log2(1 + t)
+static constexpr int32_t GAMMA_EXP2_POLY[5] = {32768, 22706, 7920, 1693, 448};  // 2^t
+static constexpr int32_t GAMMA_LOG2_255_Q15 = 261959;  // log2(255) * 32768
+
+static FORCEINLINE int32_t gamma_poly_q15(const int32_t* c, int32_t t) {
+    // Horner: ((((c4 * t >> 15) + c3) * t >> 15) + c2) ... + c0
+    int32_t acc = c[4];
+    acc = (int32_t)(((int64_t)acc * t) >> 15) + c[3];
+    acc = (int32_t)(((int64_t)acc * t) >> 15) + c[2];
+    acc = (int32_t)(((int64_t)acc * t) >> 15) + c[1];
+    acc = (int32_t)(((int64_t)acc * t) >> 15) + c[0];
+    return acc;
+}
+
+/**
+ * @brief Integer gamma: 255 * (x / 255) ^ (inv_gamma_q8 / 256)
+ * For runtime-variable gamma (e.g. a slider); GAMMA_LUT_22 is faster
+ * for the fixed sRGB curve.
+ * HARDWARE: no FPU / pow() - two Q15 Horner polynomials and shifts
+ * 
+ * @param x Input channel value
+ * @param inv_gamma_q8 Exponent 1/gamma in Q8 (256 / 2.2 = 116 for sRGB)
+ * @return Gamma-corrected channel value (within 1 of the float result)
+ */
+static inline uint8_t gamma_int(uint8_t x, uint16_t inv_gamma_q8) {
+    if (x == 0) return 0;
+    
+    // log2(x) = e + log2(1 + t) with x = 2^e * (1 + t)
+    int e = 31 - __builtin_clz((uint32_t)x);
+    int32_t t = (int32_t)(((uint32_t)x << 15) >> e) - 32768;
+    int32_t lg = (e << 15) + gamma_poly_q15(GAMMA_LOG2_POLY, t) - GAMMA_LOG2_255_Q15;
+    
+    // z = log2(x / 255) / gamma <= 0, split into floor (zi) and fraction (f)
+    int32_t z = (int32_t)(((int64_t)lg * inv_gamma_q8) >> 8);
+    int32_t zi = z >> 15;
+    if (zi < -16) return 0;
+    int32_t f = z & 0x7FFF;
+    
+    // 255 * 2^z = (255 * 2^f) >> -zi, rounded
+    int shift = 15 - zi;
+    uint32_t out = (255u * (uint32_t)gamma_poly_q15(GAMMA_EXP2_POLY, f) + (1u << (shift - 1))) >> shift;
+    return out > 255 ? 255 : (uint8_t)out;
+}
+
+
+/**
+ * @brief Integer square root, floor(sqrt(n)) for n < 65536
+ * HARDWARE: Shift-and-add, 8 iterations of compare/subtract/shift,
+ *           no multiply or divide.
+ *           Vignette factor for d2 <= max_d2 (64-bit product, since
+ *           d2 * 65025 overflows uint32_t once d2 > 66051):
+ *           255 - isqrt8((uint32_t)((uint64_t)d2 * 65025 / max_d2))
+ *           which equals VIGNETTE_LUT[i] when d2 * 256 == i * max_d2.
+ * 
+ * @param n Value to take the square root of (< 65536)
+ * @return floor(sqrt(n))
+ */
+static inline uint8_t isqrt8(uint32_t n) {
+    uint32_t root = 0;
+    for (uint32_t bit = 1u << 14; bit != 0; bit >>= 2) {
+        if (n >= root + bit) {
+            n -= root + bit;
+            root = (root >> 1) + bit;
+        } else {
+            root >>= 1;
+        }
     }
+    return (uint8_t)root;
 }
 
 
@@ -21,10 +21,14 @@ HARDWARE TARGETING:
 """
 
 import argparse
+import functools
+import io
 import math
-import os
 from pathlib import Path
-from typing import List, Tuple, Dict
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
 
 # ============================================================
 # CONFIGURATION
@@ -34,6 +38,22 @@ from typing import List, Tuple, Dict
 Q8_SCALE = 256      # Q8: 8 fractional bits (shift right by 8)
 Q15_SCALE = 32768   # Q15: 15 fractional bits
 
+# Fixed-point formats selectable for the emitted filters
+QFORMATS = ("q8", "q15")
+
+# Targets for the emitted sepia filter. esp32 code also builds on any
+# host; other targets add a variant gated on their compiler macro.
+TARGETS = ("esp32", "wasm-simd", "x86-vnni")
+
+# Large (64K-entry) LUTs are split into chunks of this many entries,
+# sampled as NAME[i >> LUT_CHUNK_SHIFT][i & LUT_CHUNK_MASK]
+LUT_CHUNK_SHIFT = 13
+LUT_CHUNK_SIZE = 1 << LUT_CHUNK_SHIFT   # 8192 entries (16KB of uint16_t)
+
+# Alignment (bytes) of every emitted table: one ESP32-S3 cache line,
+# also enough for 32-bit L32I and 128-bit EE.VLD.128.IP loads
+LUT_ALIGN = 32
+
 # Grayscale luminance coefficients (ITU-R BT.601)
 # Y = 0.299*R + 0.587*G + 0.114*B
 LUMA_R = 0.299
@@ -52,6 +72,9 @@ VINTAGE_WARMTH = 30      # Orange/yellow shift
 VINTAGE_FADE = 20        # Lift shadows
 VINTAGE_DESAT = 0.7      # 70% saturation
 
+# Channel order for the sepia matrix LUTs (output channel, input channel)
+SEPIA_KEYS = ['RR', 'RG', 'RB', 'GR', 'GG', 'GB', 'BR', 'BG', 'BB']
+
 # Cool color adjustment
 COOL_SHIFT = 25          # Blue shift amount
 COOL_CONTRAST = 1.08     # 8% contrast boost
@@ -59,8 +82,46 @@ COOL_CONTRAST = 1.08     # 8% contrast boost
 # ============================================================
 # LUT GENERATION FUNCTIONS
 # ============================================================
+# Generators are memoized: the same table (e.g. gamma 2.2) may be
+# requested several times per run. Results are returned as tuples
+# (and read-only mappings) so a cached table cannot be mutated.
+
+def normalize_multiplier(m: float, bits: int = 15) -> Tuple[int, int]:
+    """
+    Express a real multiplier as an integer multiply + right shift.
+    
+    m = M0 * 2^-n, with M0 normalized to [0.5, 1) * 2^bits so it uses
+    every bit of the multiplier register (Jacob et al., integer-only
+    inference). At runtime: y = (x * M0) >> n.
+    
+    Example: LUMA_R = 0.299 -> M0 = 19595, n = 16 (vs Q8: 77, n = 8),
+    i.e. 15 significant bits instead of 7.
+    
+    Args:
+        m: Positive real multiplier
+        bits: Multiplier width in bits (15 fits int16)
+    
+    Returns:
+        Tuple of (M0, n)
+    """
+    if m <= 0:
+        raise ValueError(f"multiplier must be positive, got {m}")
+    
+    # m = frac * 2^exp with frac in [0.5, 1)
+    frac, exp = math.frexp(m)
+    m0 = int(frac * (1 << bits) + 0.5)
+    n = bits - exp
+    
+    # Rounding can carry frac up to 1.0 - renormalize
+    if m0 == 1 << bits:
+        m0 >>= 1
+        n -= 1
+    
+    return m0, n
+
 
-def generate_grayscale_lut() -> Tuple[List[int], List[int], List[int]]:
+@functools.lru_cache(maxsize=16)
+def generate_grayscale_lut() -> Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]]:
     """
     Generate RGB-to-grayscale lookup tables.
     
@@ -72,22 +133,77 @@ def generate_grayscale_lut() -> Tuple[List[int], List[int], List[int]]:
     Each LUT entry is the weighted contribution of that channel.
     Sum is done with integer addition (fast) instead of multiply (slow).
     
+    All three tables are built in one broadcast: a (3, 1) column of
+    normalized multipliers times a (1, 256) row of inputs, each row
+    shifted by its own n (see normalize_multiplier).
+    
     Returns:
         Tuple of (R_LUT, G_LUT, B_LUT), each with 256 entries
     """
-    # Q8 coefficients
-    coef_r = int(LUMA_R * Q8_SCALE + 0.5)  # 77
-    coef_g = int(LUMA_G * Q8_SCALE + 0.5)  # 150
-    coef_b = int(LUMA_B * Q8_SCALE + 0.5)  # 29
+    # Normalized multipliers: (19595, 16), (19235, 15), (29884, 18)
+    m0, shift = np.array([normalize_multiplier(m, 15) for m in (LUMA_R, LUMA_G, LUMA_B)],
+                         dtype=np.int32).T
     
-    lut_r = [(i * coef_r) >> 8 for i in range(256)]
-    lut_g = [(i * coef_g) >> 8 for i in range(256)]
-    lut_b = [(i * coef_b) >> 8 for i in range(256)]
+    table = (np.arange(256, dtype=np.int32)[None, :] * m0[:, None]) >> shift[:, None]
     
+    lut_r, lut_g, lut_b = (tuple(row.tolist()) for row in table)
     return lut_r, lut_g, lut_b
 
 
-def generate_sepia_lut() -> Dict[str, List[int]]:
+@functools.lru_cache(maxsize=16)
+def generate_grayscale_rgb565_lut() -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """
+    Generate grayscale LUTs indexed directly by RGB565 bit fields.
+    
+    OPTIMIZATION: R and B are only 5 bits each in RGB565, so their
+    weighted contributions are pre-summed into one 32x32 table:
+    
+    luma = (GRAY_RB_LUT[r5 << 5 | b5] + GRAY_G_LUT[g6]) >> 8
+    
+    That is 2 loads + 1 add per pixel instead of 3 loads + 2 adds,
+    and both tables (2176 bytes) stay resident in cache.
+    Entries are kept in Q8 and shifted once after the sum, which also
+    avoids the per-channel truncation of GRAY_LUT_R/G/B.
+    
+    Q8 is the widest common format whose sum still fits uint16, so
+    the entries are not products of 8-bit coefficients (77/150/29):
+    each is x * M0 from normalize_multiplier, taken to the largest
+    common shift and rounded once to Q8.
+    
+    Returns:
+        Tuple of (RB_LUT with 1024 entries, G_LUT with 64 entries)
+    """
+    (m0_r, n_r), (m0_g, n_g), (m0_b, n_b) = (normalize_multiplier(m, 15)
+                                             for m in (LUMA_R, LUMA_G, LUMA_B))
+    n_max = max(n_r, n_g, n_b)
+    
+    def to_q8(products):
+        shift = n_max - 8
+        return (products + (1 << (shift - 1))) >> shift
+    
+    # Expand 5/6-bit fields to 8-bit the same way the filters unpack them
+    r8 = np.arange(32, dtype=np.int64) << 3
+    b8 = np.arange(32, dtype=np.int64) << 3
+    g8 = np.arange(64, dtype=np.int64) << 2
+    
+    rb = to_q8((r8[:, None] * m0_r << (n_max - n_r)) + (b8[None, :] * m0_b << (n_max - n_b))).ravel()
+    g = to_q8(g8 * m0_g << (n_max - n_g))
+    
+    return tuple(rb.tolist()), tuple(g.tolist())
+
+
+def sepia_q8_coefficients() -> List[int]:
+    """
+    Quantize the sepia matrix to Q8 (truncating, as the LUTs always have).
+    
+    Returns:
+        9 coefficients in row-major order (RR, RG, RB, GR, ... BB)
+    """
+    return (np.array(SEPIA_MATRIX) * Q8_SCALE).astype(np.int32).ravel().tolist()
+
+
+@functools.lru_cache(maxsize=16)
+def generate_sepia_lut() -> Mapping[str, Tuple[int, ...]]:
     """
     Generate sepia transformation lookup tables.
     
@@ -97,29 +213,131 @@ def generate_sepia_lut() -> Dict[str, List[int]]:
     [tb]   [0.272  0.534  0.131] [b]
     
     We generate separate LUTs for each (output, input) combination.
+    The 9 Q8 coefficients are broadcast against a single 0..255 ramp,
+    so all 9 tables come out of one (9, 256) array operation.
     
     Returns:
-        Dict with keys: 'RR', 'RG', 'RB', 'GR', 'GG', 'GB', 'BR', 'BG', 'BB'
+        Read-only mapping with keys: 'RR', 'RG', 'RB', 'GR', 'GG', 'GB', 'BR', 'BG', 'BB'
+    """
+    coefs = np.array(sepia_q8_coefficients(), dtype=np.int32)
+    
+    table = ((np.arange(256, dtype=np.int32)[None, :] * coefs[:, None]) >> 8).astype(np.uint8)
+    
+    return MappingProxyType({key: tuple(table[i].tolist()) for i, key in enumerate(SEPIA_KEYS)})
+
+
+@functools.lru_cache(maxsize=16)
+def generate_sepia_rgb565_lut() -> Tuple[int, ...]:
     """
-    luts = {}
+    Generate a fused RGB565 -> RGB565 sepia lookup table.
+    
+    OPTIMIZATION: Sepia is a pure function of the 16-bit input pixel,
+    so unpack, 3x3 matrix, saturate and repack collapse into:
     
-    # Convert matrix to Q8 and create LUTs
-    luts['RR'] = [(i * int(SEPIA_MATRIX[0][0] * Q8_SCALE)) >> 8 for i in range(256)]
-    luts['RG'] = [(i * int(SEPIA_MATRIX[0][1] * Q8_SCALE)) >> 8 for i in range(256)]
-    luts['RB'] = [(i * int(SEPIA_MATRIX[0][2] * Q8_SCALE)) >> 8 for i in range(256)]
+    pixels[i] = SEPIA_RGB565[pixels[i]]
     
-    luts['GR'] = [(i * int(SEPIA_MATRIX[1][0] * Q8_SCALE)) >> 8 for i in range(256)]
-    luts['GG'] = [(i * int(SEPIA_MATRIX[1][1] * Q8_SCALE)) >> 8 for i in range(256)]
-    luts['GB'] = [(i * int(SEPIA_MATRIX[1][2] * Q8_SCALE)) >> 8 for i in range(256)]
+    One 16-bit load replaces 9 LUT reads, 3 clamps and the repack,
+    at the cost of 128KB (65536 x uint16). Uses the same Q8 terms as
+    SEPIA_LUT_xx, so the output is identical to filter_sepia_lut.
     
-    luts['BR'] = [(i * int(SEPIA_MATRIX[2][0] * Q8_SCALE)) >> 8 for i in range(256)]
-    luts['BG'] = [(i * int(SEPIA_MATRIX[2][1] * Q8_SCALE)) >> 8 for i in range(256)]
-    luts['BB'] = [(i * int(SEPIA_MATRIX[2][2] * Q8_SCALE)) >> 8 for i in range(256)]
+    Returns:
+        65536-entry LUT indexed by the input RGB565 pixel
+    """
+    coefs = np.array(sepia_q8_coefficients(), dtype=np.int32).reshape(3, 3)
     
-    return luts
+    p = np.arange(65536, dtype=np.int32)
+    rgb = np.stack([(p >> 8) & 0xF8, (p >> 3) & 0xFC, (p << 3) & 0xF8])
+    
+    # (3 out, 3 in, N) per-term products, truncated per term like the LUTs
+    out = ((coefs[:, :, None] * rgb[None, :, :]) >> 8).sum(axis=1)
+    r, g, b = np.minimum(out, 255)
+    
+    return tuple((((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)).tolist())
+
+
+# ------------------------------------------------------------
+# 3D LUT styles
+# ------------------------------------------------------------
+# A style is a per-pixel function of (r, g, b) taking and returning
+# NumPy int32 arrays of 8-bit channels (unpacked the way the filters
+# unpack RGB565). Adding a style is data-only: write the transform,
+# register it in STYLE_TRANSFORMS, and apply_3dlut() runs it.
+
+def sepia_transform(r, g, b):
+    """Sepia matrix with the same Q8 terms as SEPIA_LUT_xx"""
+    c = sepia_q8_coefficients()
+    tr = ((r * c[0]) >> 8) + ((g * c[1]) >> 8) + ((b * c[2]) >> 8)
+    tg = ((r * c[3]) >> 8) + ((g * c[4]) >> 8) + ((b * c[5]) >> 8)
+    tb = ((r * c[6]) >> 8) + ((g * c[7]) >> 8) + ((b * c[8]) >> 8)
+    return tr, tg, tb
+
+
+def vintage_transform(r, g, b):
+    """Desaturate, warm up and lift shadows (as filter_vintage_hpc)"""
+    desat = int(VINTAGE_DESAT * Q8_SCALE)
+    lum = (r * 77 + g * 150 + b * 29) >> 8
+    
+    r = (r * desat + lum * (256 - desat)) >> 8
+    g = (g * desat + lum * (256 - desat)) >> 8
+    b = (b * desat + lum * (256 - desat)) >> 8
+    
+    r = np.clip(r + VINTAGE_WARMTH, VINTAGE_FADE, 255)
+    g = np.clip(g + (VINTAGE_WARMTH >> 1), VINTAGE_FADE, 255)
+    b = np.maximum(b, VINTAGE_FADE)
+    return r, g, b
+
+
+def cool_transform(r, g, b):
+    """Contrast boost plus blue/cyan tint (as filter_cool_hpc)"""
+    contrast = int(COOL_CONTRAST * Q8_SCALE)
+    r = (((r - 128) * contrast) >> 8) + 128 - (COOL_SHIFT >> 1)
+    g = (((g - 128) * contrast) >> 8) + 128 + (COOL_SHIFT >> 2)
+    b = (((b - 128) * contrast) >> 8) + 128 + COOL_SHIFT
+    return r, g, b
 
 
-def generate_gamma_lut(gamma: float = 2.2) -> List[int]:
+STYLE_TRANSFORMS = {
+    "sepia": sepia_transform,
+    "vintage": vintage_transform,
+    "cool": cool_transform,
+}
+
+
+@functools.lru_cache(maxsize=16)
+def generate_3dlut_tile(transform_fn) -> Tuple[int, ...]:
+    """
+    Generate a tiled 3D LUT (RGB565 -> RGB565) for a color style.
+    
+    The cube is stored like GPUImage lookup images: one 2D tile per
+    blue level, tiles laid out in a grid. RGB565 only has 32x64x32
+    input levels, so the cube covers every input exactly and no
+    trilinear interpolation is needed:
+    
+        32 blue tiles of 32 (r) x 64 (g), 8 across x 4 down
+        -> 256 x 256 image = 65536 uint16 (128KB)
+    
+        idx = ((b5 >> 3) * 64 + g6) * 256 + (b5 & 7) * 32 + r5
+    
+    Args:
+        transform_fn: Style function (see STYLE_TRANSFORMS)
+    
+    Returns:
+        65536-entry LUT in tile order
+    """
+    # Tile coordinates of every cell
+    y, x = np.divmod(np.arange(256 * 256, dtype=np.int32), 256)
+    b5 = (y >> 6) * 8 + (x >> 5)
+    g6 = y & 0x3F
+    r5 = x & 0x1F
+    
+    r, g, b = transform_fn(r5 << 3, g6 << 2, b5 << 3)
+    r, g, b = (np.clip(c, 0, 255) for c in (r, g, b))
+    
+    return tuple((((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)).tolist())
+
+
+@functools.lru_cache(maxsize=16)
+def generate_gamma_lut(gamma: float = 2.2) -> Tuple[int, ...]:
     """
     Generate gamma correction lookup table.
     
@@ -134,10 +352,26 @@ def generate_gamma_lut(gamma: float = 2.2) -> List[int]:
         256-entry LUT mapping input value to gamma-corrected output
     """
     inv_gamma = 1.0 / gamma
-    return [int(255.0 * pow(i / 255.0, inv_gamma) + 0.5) for i in range(256)]
+    x = np.arange(256, dtype=np.float64) / 255.0
+    return tuple((255.0 * np.power(x, inv_gamma) + 0.5).astype(np.int32).tolist())
 
 
-def generate_contrast_lut(factor: float = 1.2) -> List[int]:
+def fit_q15_polynomial(fn, terms: int = 5) -> Tuple[int, ...]:
+    """
+    Fit fn on [0, 1] with a Chebyshev series (near-minimax) and return
+    power-basis coefficients c0..c{terms-1} quantized to Q15.
+    
+    The C side evaluates the result with Horner's scheme:
+    ((c4 * t >> 15) + c3) * t >> 15 ... + c0, t in Q15.
+    """
+    t = np.linspace(0.0, 1.0, 1025)
+    series = np.polynomial.chebyshev.Chebyshev.fit(t, fn(t), terms - 1, domain=[0.0, 1.0])
+    coefs = series.convert(kind=np.polynomial.Polynomial, domain=[0.0, 1.0], window=[0.0, 1.0]).coef
+    return tuple(to_q15(c) for c in coefs)
+
+
+@functools.lru_cache(maxsize=16)
+def generate_contrast_lut(factor: float = 1.2) -> Tuple[int, ...]:
     """
     Generate contrast adjustment lookup table.
     
@@ -149,13 +383,13 @@ def generate_contrast_lut(factor: float = 1.2) -> List[int]:
     Returns:
         256-entry LUT
     """
-    return [
-        max(0, min(255, int((i - 128) * factor + 128 + 0.5)))
-        for i in range(256)
-    ]
+    x = np.arange(256, dtype=np.float64)
+    out = ((x - 128) * factor + 128 + 0.5).astype(np.int32)
+    return tuple(np.clip(out, 0, 255).tolist())
 
 
-def generate_brightness_lut(offset: int = 20) -> List[int]:
+@functools.lru_cache(maxsize=16)
+def generate_brightness_lut(offset: int = 20) -> Tuple[int, ...]:
     """
     Generate brightness adjustment lookup table.
     
@@ -167,31 +401,34 @@ def generate_brightness_lut(offset: int = 20) -> List[int]:
     Returns:
         256-entry LUT
     """
-    return [max(0, min(255, i + offset)) for i in range(256)]
+    return tuple(np.clip(np.arange(256, dtype=np.int32) + offset, 0, 255).tolist())
 
 
-def generate_vignette_factor_lut(size: int = 128) -> List[int]:
+@functools.lru_cache(maxsize=16)
+def generate_vignette_factor_lut(size: int = 256) -> Tuple[int, ...]:
     """
     Generate vignette darkening factors based on distance.
     
     Instead of computing sqrt(dx^2 + dy^2) at runtime, we use
     squared distance which is monotonic (good enough for vignette).
     
-    The LUT maps a normalized distance (0-127) to a darkening factor (0-255).
+    The LUT maps a normalized squared distance (0 to size-1) to a
+    darkening factor (0-255): 255 - floor(sqrt(255 * 255 * i / size)),
+    the same floor square root as the emitted isqrt8() formula, so the
+    two agree wherever d2 = i * max_d2 / size is exact.
     
     Args:
-        size: LUT size (default 128 for signed distance mapping)
+        size: LUT size (default 256)
     
     Returns:
-        LUT mapping normalized distance to darkening factor
+        LUT mapping normalized squared distance to darkening factor
     """
-    return [
-        int(255 * (1.0 - (i / size) ** 0.5) + 0.5)  # Sqrt falloff
-        for i in range(size)
-    ]
+    return tuple(255 - math.isqrt(255 * 255 * i // size)  # Sqrt falloff
+                 for i in range(size))
 
 
-def generate_rgb565_pack_lut() -> Tuple[List[int], List[int], List[int]]:
+@functools.lru_cache(maxsize=16)
+def generate_rgb565_pack_lut() -> Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]]:
     """
     Generate RGB565 packing lookup tables.
     
@@ -203,9 +440,9 @@ def generate_rgb565_pack_lut() -> Tuple[List[int], List[int], List[int]]:
     Returns:
         Tuple of (R_pack, G_pack, B_pack) LUTs
     """
-    r_pack = [((i & 0xF8) << 8) for i in range(256)]
-    g_pack = [((i & 0xFC) << 3) for i in range(256)]
-    b_pack = [(i >> 3) for i in range(256)]
+    r_pack = tuple((i & 0xF8) << 8 for i in range(256))
+    g_pack = tuple((i & 0xFC) << 3 for i in range(256))
+    b_pack = tuple(i >> 3 for i in range(256))
     
     return r_pack, g_pack, b_pack
 
@@ -214,13 +451,21 @@ def generate_rgb565_pack_lut() -> Tuple[List[int], List[int], List[int]]:
 # CODE GENERATION FUNCTIONS
 # ============================================================
 
-def format_lut_array(name: str, values: List[int], type_name: str = "uint8_t",
-                     cols: int = 16, progmem: bool = True) -> str:
+# Pre-formatted "%3d" strings for every byte value (format_lut_array)
+_U8_STRS = tuple(f"{v:3d}" for v in range(256))
+
+def format_lut_array(name: str, values: Sequence[int], type_name: str = "uint8_t",
+                     cols: int = 16, progmem: bool = True,
+                     chunk_size: Optional[int] = None) -> str:
     """
     Format a LUT as a C++ constexpr array.
     
     OPTIMIZATION: constexpr forces data into flash/ro-data section,
-    saving precious SRAM for runtime variables.
+    saving precious SRAM for runtime variables. alignas(LUT_ALIGN)
+    starts every table on a cache line so wide loads never straddle.
+    
+    Tables longer than chunk_size are split into NAME_PART0..k plus a
+    NAME[k] pointer table, indexed as NAME[i >> shift][i & mask].
     
     Args:
         name: Variable name
@@ -228,40 +473,59 @@ def format_lut_array(name: str, values: List[int], type_name: str = "uint8_t",
         type_name: C++ type (uint8_t, uint16_t, etc.)
         cols: Values per line for formatting
         progmem: If True, add PROGMEM attribute (AVR) or keep constexpr
+        chunk_size: Entries per chunk for large tables (None = one array)
     
     Returns:
         C++ array definition string
     """
-    lines = []
+    if chunk_size and len(values) > chunk_size:
+        parts = [f"{name}_PART{k}" for k in range(-(-len(values) // chunk_size))]
+        chunks = [format_lut_array(part, values[k * chunk_size:(k + 1) * chunk_size],
+                                   type_name, cols, progmem)
+                  for k, part in enumerate(parts)]
+        return "\n".join(chunks) + (
+            f"\n// {name}: {len(values)} entries, {type_name}, {len(parts)} x {chunk_size} chunks\n"
+            f"static constexpr const {type_name}* {name}[{len(parts)}] = {{\n"
+            + ",\n".join(f"    {part}" for part in parts)
+            + "\n};\n"
+        )
+    
+    out = io.StringIO()
     
     # Header comment
-    lines.append(f"// {name}: {len(values)} entries, {type_name}")
-    lines.append(f"// HARDWARE: Stored in flash (constexpr) to save SRAM")
+    out.write(f"// {name}: {len(values)} entries, {type_name}\n")
+    out.write(f"// HARDWARE: Stored in flash (constexpr) to save SRAM\n")
     
     # Array declaration
-    lines.append(f"static constexpr {type_name} {name}[{len(values)}] = {{")
-    
-    # Format values in rows
-    for i in range(0, len(values), cols):
-        row_values = values[i:i+cols]
-        if type_name in ("uint8_t", "int8_t"):
-            row_str = ", ".join(f"{v:3d}" for v in row_values)
-        else:
-            row_str = ", ".join(f"0x{v:04X}" for v in row_values)
-        
-        # Add comma except for last row
-        if i + cols < len(values):
-            lines.append(f"    {row_str},")
-        else:
-            lines.append(f"    {row_str}")
-    
-    lines.append("};")
-    lines.append("")
-    
-    return "\n".join(lines)
+    out.write(f"alignas({LUT_ALIGN}) static constexpr {type_name} {name}[{len(values)}] = {{\n")
+    
+    # Format values in rows (uint8_t uses the pre-formatted byte strings)
+    if type_name == "uint8_t":
+        # A negative value would wrap around the tuple index silently
+        lo, hi = min(values, default=0), max(values, default=0)
+        if lo < 0 or hi > 255:
+            raise ValueError(f"{name}: uint8_t values must be in 0..255, got {lo}..{hi}")
+        fmt = _U8_STRS.__getitem__
+    elif type_name == "int8_t":
+        fmt = "{:3d}".format
+    else:
+        fmt = "0x{:04X}".format
+    
+    rows = (", ".join(map(fmt, values[i:i+cols])) for i in range(0, len(values), cols))
+    
+    # Comma after every row except the last
+    out.write(",\n".join(f"    {row}" for row in rows))
+    out.write("\n};\n")
+    
+    return out.getvalue()
+
+
+def to_q15(value: float) -> int:
+    """Quantize a coefficient to Q15 (value * 32768, rounded)"""
+    return int(value * Q15_SCALE + 0.5)
 
 
-def generate_simd_filter_code(filter_name: str) -> str:
+def generate_simd_filter_code(filter_name: str, qformat: str = "q8") -> str:
     """
     Generate SIMD-optimized filter function with loop unrolling.
     
@@ -269,89 +533,732 @@ def generate_simd_filter_code(filter_name: str) -> str:
     - #pragma GCC unroll: Instructs compiler to unroll loops
     - FORCEINLINE: Eliminates function call overhead
     - IRAM_ATTR: Places code in instruction cache
+    
+    Args:
+        filter_name: Filter to emit
+        qformat: "q8" (LUT-based) or "q15" (direct Q15 multiply) for sepia
     """
     code = []
     
     if filter_name == "grayscale":
         code.append("""
+/**
+ * @brief Pack an 8-bit gray level into an RGB565 pixel
+ */
+static FORCEINLINE uint32_t gray_to_565(uint8_t gray) {
+    return (gray & 0xF8) << 8 | (gray & 0xFC) << 3 | (gray >> 3);
+}
+
+/**
+ * @brief Grayscale level of one RGB565 pixel via the pre-combined LUTs
+ * HARDWARE: 1 shifted index + 2 loads + 1 add
+ */
+static FORCEINLINE uint8_t gray_565(uint32_t p) {
+    uint16_t idx = ((p >> 6) & 0x3E0) | (p & 0x1F);  // r5 << 5 | b5
+    return (GRAY_RB_LUT[idx] + GRAY_G_LUT[(p >> 5) & 0x3F]) >> 8;
+}
+
+// uint32_t view of the uint16_t pixel buffer; may_alias keeps the SWAR
+// accesses legal under strict aliasing (same L32I/S32I code)
+typedef uint32_t __attribute__((may_alias)) pixel_pair_t;
+
 /**
  * @brief SIMD-optimized grayscale filter using LUT
- * HARDWARE: Uses pre-computed LUT (no multiply), unrolled loop
+ * HARDWARE: Uses pre-combined RB/G LUTs (no multiply), unrolled loop.
+ *           SWAR: two pixels per 32-bit load/store.
  * 
  * @param pixels Pointer to RGB565 pixel data
- * @param count Number of pixels (should be multiple of 8)
+ * @param count Number of pixels
  */
-static FORCEINLINE void IRAM_ATTR filter_grayscale_lut(uint16_t* pixels, int count) {
-    const int aligned = count & ~7;  // Process 8 at a time
+static FORCEINLINE LUT_HOT void IRAM_ATTR filter_grayscale_lut(uint16_t* __restrict__ pixels, int count) {
+    pixels = (uint16_t*)__builtin_assume_aligned(pixels, LUT_PIXEL_ALIGN);
+    int i = 0;
+    
+    // Peel one pixel so the 32-bit accesses below are word-aligned
+    if (__builtin_expect(((uintptr_t)pixels & 3) && count > 0, 0)) {
+        pixels[0] = gray_to_565(gray_565(pixels[0]));
+        i = 1;
+    }
     
-    #pragma GCC unroll 8
-    for (int i = 0; i < aligned; i++) {
-        // Extract RGB from RGB565
-        uint8_t r = (pixels[i] >> 8) & 0xF8;
-        uint8_t g = (pixels[i] >> 3) & 0xFC;
-        uint8_t b = (pixels[i] << 3) & 0xF8;
+    pixel_pair_t* __restrict__ p32 = (pixel_pair_t*)__builtin_assume_aligned(pixels + i, 4);
+    const int pairs = (count - i) >> 1;
+    
+    #pragma GCC unroll 4
+    for (int j = 0; j < pairs; j++) {
+        uint32_t v = p32[j];
         
-        // LUT-based grayscale (3 memory reads, 2 adds, no multiply!)
-        uint8_t gray = GRAY_LUT_R[r] + GRAY_LUT_G[g] + GRAY_LUT_B[b];
+        // LUT-based grayscale (4 memory reads, 2 adds for two pixels)
+        uint8_t gray0 = gray_565(v);
+        uint8_t gray1 = gray_565(v >> 16);
         
-        // Pack back to RGB565
-        pixels[i] = (gray & 0xF8) << 8 | (gray & 0xFC) << 3 | (gray >> 3);
+        // Pack both pixels back with a single 32-bit store
+        p32[j] = gray_to_565(gray0) | gray_to_565(gray1) << 16;
     }
     
-    // Handle remainder (same logic, no unroll)
-    for (int i = aligned; i < count; i++) {
-        uint8_t r = (pixels[i] >> 8) & 0xF8;
-        uint8_t g = (pixels[i] >> 3) & 0xFC;
-        uint8_t b = (pixels[i] << 3) & 0xF8;
-        uint8_t gray = GRAY_LUT_R[r] + GRAY_LUT_G[g] + GRAY_LUT_B[b];
-        pixels[i] = (gray & 0xF8) << 8 | (gray & 0xFC) << 3 | (gray >> 3);
+    // Handle odd remainder
+    i += pairs << 1;
+    if (__builtin_expect(i < count, 0)) {
+        pixels[i] = gray_to_565(gray_565(pixels[i]));
     }
 }
 """)
     
+    elif filter_name == "sepia" and qformat == "q15":
+        code.append(generate_sat8_code())
+        code.append(generate_q15_sepia_code())
+    
     elif filter_name == "sepia":
+        code.append(generate_sat8_code())
+        code.append(generate_pie_sepia_code())
         code.append("""
 /**
  * @brief SIMD-optimized sepia filter using LUT
- * HARDWARE: 9-way LUT lookup replaces 9 multiplications
+ * HARDWARE: 9-way LUT lookup replaces 9 multiplications.
+ *           On ESP32-S3 the bulk runs on the PIE kernel above and
+ *           this loop only handles the tail (or unaligned buffers).
+ * 
+ * @param pixels Pointer to RGB565 pixel data
+ * @param count Number of pixels
+ */
+static FORCEINLINE LUT_HOT void IRAM_ATTR filter_sepia_lut(uint16_t* __restrict__ pixels, int count) {
+    pixels = (uint16_t*)__builtin_assume_aligned(pixels, LUT_PIXEL_ALIGN);
+    int i = 0;
+#if LUT_USE_PIE
+    // Fewer than 8 pixels never reach the vector kernel
+    if (__builtin_expect(count >= 8, 1)) {
+        i = filter_sepia_pie(pixels, count);
+    }
+#endif
+    
+    if (i >= count) return;
+    
+    // 2-way software pipeline (the interleaved load/MAC scheme of CMSIS-DSP
+    // arm_mat_mult_fast_q15): the 9 LUT reads for pixel i+1 are issued
+    // before pixel i is saturated and stored, hiding load-use latency.
+    
+    // Prologue: matrix multiply via LUT lookups (9 reads + 6 adds vs 9 muls)
+    int r = (pixels[i] >> 8) & 0xF8;
+    int g = (pixels[i] >> 3) & 0xFC;
+    int b = (pixels[i] << 3) & 0xF8;
+    int tr = SEPIA_LUT_RR[r] + SEPIA_LUT_RG[g] + SEPIA_LUT_RB[b];
+    int tg = SEPIA_LUT_GR[r] + SEPIA_LUT_GG[g] + SEPIA_LUT_GB[b];
+    int tb = SEPIA_LUT_BR[r] + SEPIA_LUT_BG[g] + SEPIA_LUT_BB[b];
+    
+    for (; i < count - 1; i++) {
+        // Frame buffers may sit in PSRAM; the 2.3KB of LUTs stay cached
+        __builtin_prefetch(&pixels[i + 16], 1, 1);
+        
+        // Stage 1: extract pixel i+1 and issue its LUT reads
+        int rn = (pixels[i + 1] >> 8) & 0xF8;
+        int gn = (pixels[i + 1] >> 3) & 0xFC;
+        int bn = (pixels[i + 1] << 3) & 0xF8;
+        int trn = SEPIA_LUT_RR[rn] + SEPIA_LUT_RG[gn] + SEPIA_LUT_RB[bn];
+        int tgn = SEPIA_LUT_GR[rn] + SEPIA_LUT_GG[gn] + SEPIA_LUT_GB[bn];
+        int tbn = SEPIA_LUT_BR[rn] + SEPIA_LUT_BG[gn] + SEPIA_LUT_BB[bn];
+        
+        // Stage 2: saturate (branchless) and pack pixel i
+        pixels[i] = (sat8(tr) & 0xF8) << 8 | (sat8(tg) & 0xFC) << 3 | (sat8(tb) >> 3);
+        
+        tr = trn;
+        tg = tgn;
+        tb = tbn;
+    }
+    
+    // Epilogue: last pixel
+    pixels[i] = (sat8(tr) & 0xF8) << 8 | (sat8(tg) & 0xFC) << 3 | (sat8(tb) >> 3);
+}
+""")
+    
+    elif filter_name == "sepia_fused":
+        code.append("""
+/**
+ * @brief Sepia filter using the fused 64K-entry RGB565 LUT
+ * HARDWARE: One chunk-pointer and one 16-bit table read per pixel.
+ *           Bandwidth-bound on flash cache reads (128KB table).
+ * 
+ * @param pixels Pointer to RGB565 pixel data
+ * @param count Number of pixels
+ */
+static FORCEINLINE LUT_HOT void IRAM_ATTR filter_sepia_fused(uint16_t* __restrict__ pixels, int count) {
+    pixels = (uint16_t*)__builtin_assume_aligned(pixels, LUT_PIXEL_ALIGN);
+    
+    #pragma GCC unroll 16
+    for (int i = 0; i < count; i++) {
+        uint32_t p = pixels[i];
+        pixels[i] = SEPIA_RGB565[p >> LUT_CHUNK_SHIFT][p & LUT_CHUNK_MASK];
+    }
+}
+""")
+    
+    elif filter_name == "3dlut":
+        code.append("""
+/**
+ * @brief Apply a tiled 3D color LUT (any *_3DLUT table)
+ * HARDWARE: One index computation + one 16-bit table read per pixel.
+ *           Every color style shares this loop; styles are data only.
+ * 
+ * @param pixels Pointer to RGB565 pixel data
+ * @param count Number of pixels
+ * @param lut Chunk table of a 65536-entry tiled LUT (e.g. SEPIA_3DLUT)
+ */
+static FORCEINLINE LUT_HOT void IRAM_ATTR apply_3dlut(uint16_t* __restrict__ pixels, int count,
+                                                     const uint16_t* const* __restrict__ lut) {
+    pixels = (uint16_t*)__builtin_assume_aligned(pixels, LUT_PIXEL_ALIGN);
+    
+    #pragma GCC unroll 8
+    for (int i = 0; i < count; i++) {
+        uint32_t p = pixels[i];
+        uint32_t r5 = p >> 11;
+        uint32_t g6 = (p >> 5) & 0x3F;
+        uint32_t b5 = p & 0x1F;
+        
+        // Blue picks the tile (8 across x 4 down), r/g index inside it
+        uint32_t idx = ((b5 >> 3) * 64 + g6) * 256 + (b5 & 7) * 32 + r5;
+        pixels[i] = lut[idx >> LUT_CHUNK_SHIFT][idx & LUT_CHUNK_MASK];
+    }
+}
+""")
+    
+    return "\n".join(code)
+
+
+def generate_sat8_code() -> str:
+    """
+    Generate sat8(), the branchless clamp to [0, 255] used after the
+    sepia matrix multiply.
+    
+    Three data-dependent branches per pixel mispredict on ordinary
+    photos. On ESP32-S3 the clamp is MAX + MINU (LX7 MINMAX option),
+    elsewhere a sign-mask form the compiler keeps branch-free.
+    """
+    return """
+/**
+ * @brief Clamp to [0, 255] without branches
+ * HARDWARE: ESP32-S3 - MAX + MINU, 2 single-cycle ALU ops
+ */
+static FORCEINLINE int sat8(int v) {
+#if LUT_USE_PIE
+    int r;
+    __asm__ ("max  %0, %1, %2\\n\\t"
+             "minu %0, %0, %3"
+             : "=&a"(r) : "a"(v), "a"(0), "a"(255));
+    return r;
+#else
+    // v & ~(v >> 31) drops negatives; (255 - t) >> 31 is all ones above 255
+    int t = v & ~(v >> 31);
+    return (t | ((255 - t) >> 31)) & 0xFF;
+#endif
+}
+"""
+
+
+def sepia_q15_constants() -> str:
+    """Emit the sepia matrix as SEPIA_xx_Q15 int16_t constants"""
+    consts = []
+    for i, row in enumerate(SEPIA_MATRIX):
+        for j, val in enumerate(row):
+            name = f"SEPIA_{'RGB'[i]}{'RGB'[j]}_Q15"
+            consts.append(f"static constexpr int16_t {name} = {to_q15(val)};  // {val:.3f} * 32768")
+    return "\n".join(consts)
+
+
+def generate_q15_sepia_code() -> str:
+    """
+    Generate the Q15 sepia filter (--qformat q15).
+    
+    Same cost as Q8 (one 16x16->32 multiply per term) but 7 more
+    fractional bits, and the sum is rounded once with +0x4000 instead
+    of truncating each of the 9 terms. No LUTs are read.
+    """
+    return """
+// Sepia matrix coefficients (Q15)
+""" + sepia_q15_constants() + """
+
+/**
+ * @brief Sepia filter using Q15 fixed-point multiply
+ * HARDWARE: 9 integer MACs per pixel, single rounding shift per channel
  * 
  * @param pixels Pointer to RGB565 pixel data
  * @param count Number of pixels
  */
-static FORCEINLINE void IRAM_ATTR filter_sepia_lut(uint16_t* pixels, int count) {
+static FORCEINLINE LUT_HOT void IRAM_ATTR filter_sepia_lut(uint16_t* __restrict__ pixels, int count) {
+    pixels = (uint16_t*)__builtin_assume_aligned(pixels, LUT_PIXEL_ALIGN);
+    
     #pragma GCC unroll 4
     for (int i = 0; i < count; i++) {
         // Extract RGB
-        uint8_t r = (pixels[i] >> 8) & 0xF8;
-        uint8_t g = (pixels[i] >> 3) & 0xFC;
-        uint8_t b = (pixels[i] << 3) & 0xF8;
+        int r = (pixels[i] >> 8) & 0xF8;
+        int g = (pixels[i] >> 3) & 0xFC;
+        int b = (pixels[i] << 3) & 0xF8;
         
-        // Matrix multiply via LUT lookups (9 reads + 6 adds vs 9 muls)
-        int tr = SEPIA_LUT_RR[r] + SEPIA_LUT_RG[g] + SEPIA_LUT_RB[b];
-        int tg = SEPIA_LUT_GR[r] + SEPIA_LUT_GG[g] + SEPIA_LUT_GB[b];
-        int tb = SEPIA_LUT_BR[r] + SEPIA_LUT_BG[g] + SEPIA_LUT_BB[b];
+        // Matrix multiply in Q15, +0x4000 rounds to nearest
+        int tr = (SEPIA_RR_Q15 * r + SEPIA_RG_Q15 * g + SEPIA_RB_Q15 * b + 0x4000) >> 15;
+        int tg = (SEPIA_GR_Q15 * r + SEPIA_GG_Q15 * g + SEPIA_GB_Q15 * b + 0x4000) >> 15;
+        int tb = (SEPIA_BR_Q15 * r + SEPIA_BG_Q15 * g + SEPIA_BB_Q15 * b + 0x4000) >> 15;
         
-        // Saturate to 255
-        r = tr > 255 ? 255 : tr;
-        g = tg > 255 ? 255 : tg;
-        b = tb > 255 ? 255 : tb;
+        // Saturate to 255 (branchless)
+        r = sat8(tr);
+        g = sat8(tg);
+        b = sat8(tb);
         
         // Pack back
         pixels[i] = (r & 0xF8) << 8 | (g & 0xFC) << 3 | (b >> 3);
     }
 }
-""")
+"""
+
+
+def generate_pie_sepia_code() -> str:
+    """
+    Generate the ESP32-S3 PIE (128-bit SIMD) sepia kernel.
     
-    return "\n".join(code)
+    HARDWARE EXPLOITATION:
+    - EE.VLD.128.IP / EE.VST.128.IP: 8 RGB565 pixels per Q register
+    - EE.VMUL.U16: 8 lanes of (channel * coef) >> SAR per instruction
+    - EE.VADDS.S16 + EE.VMIN.S16: accumulate and saturate to 255
+    - 9 vector multiplies per 8 pixels replace 72 LUT reads
+    
+    Each term is (x * c) >> 8, the same rounding as SEPIA_LUT_xx[x],
+    so the output is bit-identical to the scalar LUT path.
+    
+    RGB565 fields never cross a 16-bit lane after masking, so the
+    32-bit EE.VSL.32 / EE.VSR.32 shifts act as per-lane 16-bit shifts.
+    """
+    rr, rg, rb, gr, gg, gb, br, bg, bb = sepia_q8_coefficients()
+    
+    return f"""
+#if LUT_USE_PIE
+// Broadcast constants for filter_sepia_pie, in the order they are loaded
+alignas(16) static constexpr uint16_t SEPIA_PIE_CONST[16] = {{
+    0x00F8, 0x00FC,                     // R/B and G unpack masks
+    {rr:3d}, {rg:3d}, {rb:3d},                      // R' = RR*r + RG*g + RB*b (Q8)
+    {gr:3d}, {gg:3d}, {gb:3d},                      // G'
+    {br:3d}, {bg:3d}, {bb:3d},                      // B'
+    0x00FF,                             // Saturation limit
+    0x00F8, 0x00FC, 0x001F,             // R, G, B repack masks
+    0x0000
+}};
+
+/**
+ * @brief Sepia filter on the ESP32-S3 PIE vector unit
+ * HARDWARE: 8 pixels per iteration, 9 vector MULs + 6 saturating adds
+ * 
+ * @param pixels Pointer to RGB565 pixel data (16-byte aligned)
+ * @param count Number of pixels
+ * @return Number of pixels processed (multiple of 8, 0 if unaligned)
+ */
+static FORCEINLINE LUT_HOT int IRAM_ATTR filter_sepia_pie(uint16_t* __restrict__ pixels, int count) {{
+    pixels = (uint16_t*)__builtin_assume_aligned(pixels, LUT_PIXEL_ALIGN);
+    
+    // EE.VLD.128 ignores the low address bits - leave unaligned data to scalar
+    // (folded away at compile time when LUT_PIXEL_ALIGN >= 16)
+    if (__builtin_expect((uintptr_t)pixels & 15, 0)) return 0;
+    
+    const int aligned = count & ~7;
+    uint16_t* p = pixels;
+    
+    for (int i = 0; i < aligned; i += 8) {{
+        const uint16_t* k = SEPIA_PIE_CONST;
+        __asm__ __volatile__ (
+            "ee.vld.128.ip   q0, %[p], 0      \\n"  // q0 = 8 pixels
+            
+            // Unpack: q1 = r8, q2 = g8, q3 = b8
+            "ssai            8                \\n"
+            "ee.vsr.32       q1, q0           \\n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \\n"  // 0x00F8
+            "ee.andq         q1, q1, q7       \\n"
+            "ssai            3                \\n"
+            "ee.vsl.32       q3, q0           \\n"
+            "ee.andq         q3, q3, q7       \\n"
+            "ee.vsr.32       q2, q0           \\n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \\n"  // 0x00FC
+            "ee.andq         q2, q2, q7       \\n"
+            
+            // Matrix multiply: (x * c) >> 8 per term
+            "ssai            8                \\n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \\n"  // RR
+            "ee.vmul.u16     q4, q1, q7       \\n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \\n"  // RG
+            "ee.vmul.u16     q5, q2, q7       \\n"
+            "ee.vadds.s16    q4, q4, q5       \\n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \\n"  // RB
+            "ee.vmul.u16     q5, q3, q7       \\n"
+            "ee.vadds.s16    q4, q4, q5       \\n"  // q4 = tr
+            
+            "ee.vldbc.16.ip  q7, %[k], 2      \\n"  // GR
+            "ee.vmul.u16     q5, q1, q7       \\n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \\n"  // GG
+            "ee.vmul.u16     q6, q2, q7       \\n"
+            "ee.vadds.s16    q5, q5, q6       \\n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \\n"  // GB
+            "ee.vmul.u16     q6, q3, q7       \\n"
+            "ee.vadds.s16    q5, q5, q6       \\n"  // q5 = tg
+            
+            "ee.vldbc.16.ip  q7, %[k], 2      \\n"  // BR
+            "ee.vmul.u16     q6, q1, q7       \\n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \\n"  // BG
+            "ee.vmul.u16     q0, q2, q7       \\n"
+            "ee.vadds.s16    q6, q6, q0       \\n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \\n"  // BB
+            "ee.vmul.u16     q0, q3, q7       \\n"
+            "ee.vadds.s16    q6, q6, q0       \\n"  // q6 = tb
+            
+            // Saturate to 255
+            "ee.vldbc.16.ip  q7, %[k], 2      \\n"  // 0x00FF
+            "ee.vmin.s16     q4, q4, q7       \\n"
+            "ee.vmin.s16     q5, q5, q7       \\n"
+            "ee.vmin.s16     q6, q6, q7       \\n"
+            
+            // Repack: (r & 0xF8) << 8 | (g & 0xFC) << 3 | b >> 3
+            "ee.vldbc.16.ip  q7, %[k], 2      \\n"  // 0x00F8
+            "ee.andq         q4, q4, q7       \\n"
+            "ee.vsl.32       q4, q4           \\n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \\n"  // 0x00FC
+            "ee.andq         q5, q5, q7       \\n"
+            "ssai            3                \\n"
+            "ee.vsl.32       q5, q5           \\n"
+            "ee.vsr.32       q6, q6           \\n"
+            "ee.vldbc.16.ip  q7, %[k], 2      \\n"  // 0x001F
+            "ee.andq         q6, q6, q7       \\n"
+            "ee.orq          q4, q4, q5       \\n"
+            "ee.orq          q4, q4, q6       \\n"
+            "ee.vst.128.ip   q4, %[p], 16     \\n"
+            : [p] "+r" (p), [k] "+r" (k)
+            :
+            : "memory"
+        );
+    }}
+    
+    return aligned;
+}}
+#endif // LUT_USE_PIE
+"""
 
 
-def generate_header_file(output_path: str, include_all: bool = True):
+def generate_gamma_code() -> str:
+    """
+    Generate gamma_int(), integer gamma for a runtime-variable exponent.
+    
+    x^p has no single polynomial in x for a variable p, so it is split
+    into x^p = 2^(p * log2 x): log2(1 + t) and 2^t on [0, 1) are each a
+    5-term Q15 polynomial, the integer part of both is a shift.
+    GAMMA_LUT_22 stays the fast path for the fixed sRGB curve.
+    """
+    log2_poly = fit_q15_polynomial(lambda t: np.log2(1.0 + t))
+    exp2_poly = fit_q15_polynomial(lambda t: np.exp2(t))
+    
+    return f"""
+// Q15 polynomial coefficients c0..c4, t in [0, 1) (fitted by convert.py)
+static constexpr int32_t GAMMA_LOG2_POLY[5] = {{{", ".join(map(str, log2_poly))}}};  // log2(1 + t)
+static constexpr int32_t GAMMA_EXP2_POLY[5] = {{{", ".join(map(str, exp2_poly))}}};  // 2^t
+static constexpr int32_t GAMMA_LOG2_255_Q15 = {to_q15(math.log2(255))};  // log2(255) * 32768
+
+static FORCEINLINE int32_t gamma_poly_q15(const int32_t* c, int32_t t) {{
+    // Horner: ((((c4 * t >> 15) + c3) * t >> 15) + c2) ... + c0
+    int32_t acc = c[4];
+    acc = (int32_t)(((int64_t)acc * t) >> 15) + c[3];
+    acc = (int32_t)(((int64_t)acc * t) >> 15) + c[2];
+    acc = (int32_t)(((int64_t)acc * t) >> 15) + c[1];
+    acc = (int32_t)(((int64_t)acc * t) >> 15) + c[0];
+    return acc;
+}}
+
+/**
+ * @brief Integer gamma: 255 * (x / 255) ^ (inv_gamma_q8 / 256)
+ * For runtime-variable gamma (e.g. a slider); GAMMA_LUT_22 is faster
+ * for the fixed sRGB curve.
+ * HARDWARE: no FPU / pow() - two Q15 Horner polynomials and shifts
+ * 
+ * @param x Input channel value
+ * @param inv_gamma_q8 Exponent 1/gamma in Q8 (256 / 2.2 = 116 for sRGB)
+ * @return Gamma-corrected channel value (within 1 of the float result)
+ */
+static inline uint8_t gamma_int(uint8_t x, uint16_t inv_gamma_q8) {{
+    if (x == 0) return 0;
+    
+    // log2(x) = e + log2(1 + t) with x = 2^e * (1 + t)
+    int e = 31 - __builtin_clz((uint32_t)x);
+    int32_t t = (int32_t)(((uint32_t)x << 15) >> e) - 32768;
+    int32_t lg = (e << 15) + gamma_poly_q15(GAMMA_LOG2_POLY, t) - GAMMA_LOG2_255_Q15;
+    
+    // z = log2(x / 255) / gamma <= 0, split into floor (zi) and fraction (f)
+    int32_t z = (int32_t)(((int64_t)lg * inv_gamma_q8) >> 8);
+    int32_t zi = z >> 15;
+    if (zi < -16) return 0;
+    int32_t f = z & 0x7FFF;
+    
+    // 255 * 2^z = (255 * 2^f) >> -zi, rounded
+    int shift = 15 - zi;
+    uint32_t out = (255u * (uint32_t)gamma_poly_q15(GAMMA_EXP2_POLY, f) + (1u << (shift - 1))) >> shift;
+    return out > 255 ? 255 : (uint8_t)out;
+}}
+"""
+
+
+def generate_wasm_simd_filter_code(filter_name: str) -> str:
+    """
+    Generate a WebAssembly SIMD128 filter (--target wasm-simd).
+    
+    Used when the filters are compiled for a browser preview host; the
+    caller wraps it in #ifdef __wasm_simd128__ with the ESP32 code as
+    #else, and the function keeps the ESP32 name so callers are shared.
+    
+    HARDWARE EXPLOITATION:
+    - v128: 8 RGB565 pixels per load, one uint16 lane each
+    - i16x8.q15mulr_sat_s: multiply + round + shift + saturate per lane
+    - i16x8.add_sat_s / i16x8.min_s: accumulate and clamp to 255
+    
+    Args:
+        filter_name: Only "sepia" is supported
+    
+    Returns:
+        C++ code string
+    """
+    if filter_name != "sepia":
+        raise ValueError(f"no wasm-simd variant for filter: {filter_name}")
+    
+    return """
+// Sepia matrix coefficients (Q15)
+""" + sepia_q15_constants() + """
+""" + generate_sat8_code() + """
+// One lane of i16x8.q15mulr_sat_s (operands here never saturate)
+static FORCEINLINE int q15mulr(int a, int c) {
+    return (a * c + 0x4000) >> 15;
+}
+
+/**
+ * @brief Sepia filter, WebAssembly SIMD128 (8 pixels per iteration)
+ * HARDWARE: 9 i16x8.q15mulr_sat_s per 8 pixels. Channels are scaled
+ *           by 64 in the lanes, so every product rounds at 1/64 and
+ *           the row sums (< 336 * 64) still fit int16.
+ * 
+ * @param pixels Pointer to RGB565 pixel data
+ * @param count Number of pixels
+ */
+static FORCEINLINE LUT_HOT void filter_sepia_lut(uint16_t* __restrict__ pixels, int count) {
+    const v128_t c_rr = wasm_i16x8_splat(SEPIA_RR_Q15);
+    const v128_t c_rg = wasm_i16x8_splat(SEPIA_RG_Q15);
+    const v128_t c_rb = wasm_i16x8_splat(SEPIA_RB_Q15);
+    const v128_t c_gr = wasm_i16x8_splat(SEPIA_GR_Q15);
+    const v128_t c_gg = wasm_i16x8_splat(SEPIA_GG_Q15);
+    const v128_t c_gb = wasm_i16x8_splat(SEPIA_GB_Q15);
+    const v128_t c_br = wasm_i16x8_splat(SEPIA_BR_Q15);
+    const v128_t c_bg = wasm_i16x8_splat(SEPIA_BG_Q15);
+    const v128_t c_bb = wasm_i16x8_splat(SEPIA_BB_Q15);
+    const v128_t half = wasm_i16x8_splat(32);
+    const v128_t max8 = wasm_i16x8_splat(255);
+    
+    int i = 0;
+    for (; i + 8 <= count; i += 8) {
+        v128_t p = wasm_v128_load(pixels + i);
+        
+        // Extract channels, already scaled by 64: (c & mask) << 6
+        v128_t r = wasm_v128_and(wasm_u16x8_shr(p, 2), wasm_i16x8_splat(0x3E00));
+        v128_t g = wasm_v128_and(wasm_i16x8_shl(p, 3), wasm_i16x8_splat(0x3F00));
+        v128_t b = wasm_v128_and(wasm_i16x8_shl(p, 9), wasm_i16x8_splat(0x3E00));
+        
+        // Matrix multiply in Q15 (result still scaled by 64)
+        v128_t tr = wasm_i16x8_add_sat(wasm_i16x8_add_sat(wasm_i16x8_q15mulr_sat(r, c_rr),
+                                                          wasm_i16x8_q15mulr_sat(g, c_rg)),
+                                       wasm_i16x8_q15mulr_sat(b, c_rb));
+        v128_t tg = wasm_i16x8_add_sat(wasm_i16x8_add_sat(wasm_i16x8_q15mulr_sat(r, c_gr),
+                                                          wasm_i16x8_q15mulr_sat(g, c_gg)),
+                                       wasm_i16x8_q15mulr_sat(b, c_gb));
+        v128_t tb = wasm_i16x8_add_sat(wasm_i16x8_add_sat(wasm_i16x8_q15mulr_sat(r, c_br),
+                                                          wasm_i16x8_q15mulr_sat(g, c_bg)),
+                                       wasm_i16x8_q15mulr_sat(b, c_bb));
+        
+        // Round away the scale and saturate to 255
+        tr = wasm_i16x8_min(wasm_u16x8_shr(wasm_i16x8_add_sat(tr, half), 6), max8);
+        tg = wasm_i16x8_min(wasm_u16x8_shr(wasm_i16x8_add_sat(tg, half), 6), max8);
+        tb = wasm_i16x8_min(wasm_u16x8_shr(wasm_i16x8_add_sat(tb, half), 6), max8);
+        
+        // Pack back
+        p = wasm_v128_or(wasm_v128_or(wasm_i16x8_shl(wasm_v128_and(tr, wasm_i16x8_splat(0xF8)), 8),
+                                      wasm_i16x8_shl(wasm_v128_and(tg, wasm_i16x8_splat(0xFC)), 3)),
+                         wasm_u16x8_shr(tb, 3));
+        wasm_v128_store(pixels + i, p);
+    }
+    
+    // Tail: the vector math one lane at a time (64-scaled channels,
+    // per-term rounding) so a pixel's result does not depend on its index
+    for (; i < count; i++) {
+        int r = (pixels[i] >> 2) & 0x3E00;
+        int g = (pixels[i] << 3) & 0x3F00;
+        int b = (pixels[i] << 9) & 0x3E00;
+        
+        int tr = q15mulr(r, SEPIA_RR_Q15) + q15mulr(g, SEPIA_RG_Q15) + q15mulr(b, SEPIA_RB_Q15);
+        int tg = q15mulr(r, SEPIA_GR_Q15) + q15mulr(g, SEPIA_GG_Q15) + q15mulr(b, SEPIA_GB_Q15);
+        int tb = q15mulr(r, SEPIA_BR_Q15) + q15mulr(g, SEPIA_BG_Q15) + q15mulr(b, SEPIA_BB_Q15);
+        
+        pixels[i] = (sat8((tr + 32) >> 6) & 0xF8) << 8 | (sat8((tg + 32) >> 6) & 0xFC) << 3
+                  | (sat8((tb + 32) >> 6) >> 3);
+    }
+}
+"""
+
+
+def generate_x86_vnni_filter_code(filter_name: str) -> str:
+    """
+    Generate an x86 AVX2 / AVX-512 VNNI filter (--target x86-vnni).
+    
+    For running the filters on a development host; the caller wraps it
+    in #if defined(__AVX2__) with the ESP32 code as #else, and the
+    function keeps the ESP32 name so callers are shared.
+    
+    HARDWARE EXPLOITATION:
+    - Each pixel becomes one 32-bit lane of bytes [r5, g6, b5, 0]
+    - VPDPBUSD (AVX512-VNNI + VL): r*cR + g*cG + b*cB in one instruction
+      for 8 pixels; AVX2 uses VPMADDUBSW + VPMADDWD for the same sum
+    - 16 pixels per iteration, repacked with VPACKUSDW
+    
+    The RGB565 field scales (r = r5 << 3, g = g6 << 2, b = b5 << 3) are
+    folded into the Q8 coefficients, so the dot product runs on the raw
+    fields and the sum is shifted once by 6.
+    
+    Args:
+        filter_name: Only "sepia" is supported
+    
+    Returns:
+        C++ code string
+    """
+    if filter_name != "sepia":
+        raise ValueError(f"no x86-vnni variant for filter: {filter_name}")
+    
+    consts = []
+    for key, coef in zip(SEPIA_KEYS, sepia_q8_coefficients()):
+        # r and b carry 3 bits of scale, g 2 bits: fold 8:4:8 as 2:1:2
+        dot = coef * (1 if key[1] == "G" else 2)
+        assert dot <= 0xFF, "dot coefficients are unsigned bytes"
+        consts.append(f"static constexpr uint32_t SEPIA_DOT_{key} = {dot};")
+    
+    return """
+// Sepia matrix (Q8) scaled for the raw RGB565 fields: sum >> 6
+""" + "\n".join(consts) + """
+""" + generate_sat8_code() + """
+#if defined(__AVX512VNNI__) && defined(__AVX512VL__)
+// 4 x (u8 coef * s8 field) summed into each int32 lane, one VPDPBUSD
+static FORCEINLINE __m256i sepia_dot4(__m256i coef, __m256i fields) {
+    return _mm256_dpbusd_epi32(_mm256_setzero_si256(), coef, fields);
+}
+#else
+// AVX2: pairwise VPMADDUBSW (max 18673, no saturation) + VPMADDWD
+static FORCEINLINE __m256i sepia_dot4(__m256i coef, __m256i fields) {
+    return _mm256_madd_epi16(_mm256_maddubs_epi16(coef, fields), _mm256_set1_epi16(1));
+}
+#endif
+
+// 8 pixels (zero-extended to int32 lanes) -> 8 sepia RGB565 values
+static FORCEINLINE __m256i sepia_x86_8(__m256i p) {
+    const __m256i coef_r = _mm256_set1_epi32(SEPIA_DOT_RR | SEPIA_DOT_RG << 8 | SEPIA_DOT_RB << 16);
+    const __m256i coef_g = _mm256_set1_epi32(SEPIA_DOT_GR | SEPIA_DOT_GG << 8 | SEPIA_DOT_GB << 16);
+    const __m256i coef_b = _mm256_set1_epi32(SEPIA_DOT_BR | SEPIA_DOT_BG << 8 | SEPIA_DOT_BB << 16);
+    const __m256i max8 = _mm256_set1_epi32(255);
+    
+    // Bytes [r5, g6, b5, 0] per lane
+    __m256i fields = _mm256_or_si256(
+        _mm256_or_si256(_mm256_srli_epi32(p, 11),
+                        _mm256_and_si256(_mm256_slli_epi32(p, 3), _mm256_set1_epi32(0x3F00))),
+        _mm256_slli_epi32(_mm256_and_si256(p, _mm256_set1_epi32(0x1F)), 16));
+    
+    // Matrix multiply: one dot product per output channel, saturate to 255
+    __m256i r = _mm256_min_epi32(_mm256_srli_epi32(sepia_dot4(coef_r, fields), 6), max8);
+    __m256i g = _mm256_min_epi32(_mm256_srli_epi32(sepia_dot4(coef_g, fields), 6), max8);
+    __m256i b = _mm256_min_epi32(_mm256_srli_epi32(sepia_dot4(coef_b, fields), 6), max8);
+    
+    // Pack back
+    return _mm256_or_si256(
+        _mm256_or_si256(_mm256_slli_epi32(_mm256_and_si256(r, _mm256_set1_epi32(0xF8)), 8),
+                        _mm256_slli_epi32(_mm256_and_si256(g, _mm256_set1_epi32(0xFC)), 3)),
+        _mm256_srli_epi32(b, 3));
+}
+
+/**
+ * @brief Sepia filter, x86 AVX2 / AVX-512 VNNI (16 pixels per iteration)
+ * HARDWARE: 3 dot-product instructions per 8 pixels replace 9 multiplies
+ *           and 6 adds per pixel.
+ * 
+ * @param pixels Pointer to RGB565 pixel data
+ * @param count Number of pixels
+ */
+static FORCEINLINE LUT_HOT void filter_sepia_lut(uint16_t* __restrict__ pixels, int count) {
+    int i = 0;
+    for (; i + 16 <= count; i += 16) {
+        __m256i p = _mm256_loadu_si256((const __m256i*)(pixels + i));
+        __m256i lo = sepia_x86_8(_mm256_cvtepu16_epi32(_mm256_castsi256_si128(p)));
+        __m256i hi = sepia_x86_8(_mm256_cvtepu16_epi32(_mm256_extracti128_si256(p, 1)));
+        
+        // VPACKUSDW packs per 128-bit half; restore pixel order
+        p = _mm256_permute4x64_epi64(_mm256_packus_epi32(lo, hi), 0xD8);
+        _mm256_storeu_si256((__m256i*)(pixels + i), p);
+    }
+    
+    // Tail: same math, one pixel at a time
+    for (; i < count; i++) {
+        int r = pixels[i] >> 11;
+        int g = (pixels[i] >> 5) & 0x3F;
+        int b = pixels[i] & 0x1F;
+        
+        int tr = (SEPIA_DOT_RR * r + SEPIA_DOT_RG * g + SEPIA_DOT_RB * b) >> 6;
+        int tg = (SEPIA_DOT_GR * r + SEPIA_DOT_GG * g + SEPIA_DOT_GB * b) >> 6;
+        int tb = (SEPIA_DOT_BR * r + SEPIA_DOT_BG * g + SEPIA_DOT_BB * b) >> 6;
+        
+        pixels[i] = (sat8(tr) & 0xF8) << 8 | (sat8(tg) & 0xFC) << 3 | (sat8(tb) >> 3);
+    }
+}
+"""
+
+
+def generate_isqrt_code() -> str:
+    """
+    Generate isqrt8(), the integer square root behind VIGNETTE_LUT.
+    
+    Lets runtime code compute vignette factors for a user-selected
+    radius without a table; VIGNETTE_LUT stays the fast path.
+    """
+    return """
+/**
+ * @brief Integer square root, floor(sqrt(n)) for n < 65536
+ * HARDWARE: Shift-and-add, 8 iterations of compare/subtract/shift,
+ *           no multiply or divide.
+ *           Vignette factor for d2 <= max_d2 (64-bit product, since
+ *           d2 * 65025 overflows uint32_t once d2 > 66051):
+ *           255 - isqrt8((uint32_t)((uint64_t)d2 * 65025 / max_d2))
+ *           which equals VIGNETTE_LUT[i] when d2 * 256 == i * max_d2.
+ * 
+ * @param n Value to take the square root of (< 65536)
+ * @return floor(sqrt(n))
+ */
+static inline uint8_t isqrt8(uint32_t n) {
+    uint32_t root = 0;
+    for (uint32_t bit = 1u << 14; bit != 0; bit >>= 2) {
+        if (n >= root + bit) {
+            n -= root + bit;
+            root = (root >> 1) + bit;
+        } else {
+            root >>= 1;
+        }
+    }
+    return (uint8_t)root;
+}
+"""
+
+
+def generate_header_file(output_path: str, include_all: bool = True,
+                         fat_lut: bool = False, qformat: str = "q8",
+                         styles: Sequence[str] = (), target: str = "esp32"):
     """
     Generate complete LUT header file.
     
     Args:
         output_path: Path to output .hpp file
         include_all: If True, include all LUTs; else just grayscale
+        fat_lut: If True, also emit the 128KB fused sepia LUT
+                 (compiled in only with PYFORGE_USE_FAT_LUT=1)
+        qformat: Fixed-point format for the emitted sepia filter
+        styles: 3D LUT styles to emit (128KB each, see STYLE_TRANSFORMS;
+                compiled in only with PYFORGE_USE_FAT_LUT=1)
+        target: Extra sepia variant to emit (see TARGETS)
     """
     content = []
     
@@ -368,22 +1275,56 @@ def generate_header_file(output_path: str, include_all: bool = True):
  * - All tables are constexpr (stored in flash, not SRAM)
  * - Replaces runtime multiplication with table lookup
  * - Each LUT trades flash space for CPU cycles
+ * - ESP32-S3: sepia runs on the PIE vector unit (8 pixels/iteration)
  * 
  * MEMORY USAGE:
  * - Grayscale LUTs: 768 bytes (3 x 256)
+ * - Grayscale RGB565 LUTs: 2176 bytes (1024 + 64 x uint16)
  * - Sepia LUTs: 2304 bytes (9 x 256)
- * - Total: ~3KB flash
+ * - Total: ~5KB flash
  */
 
 #include <stdint.h>
 
+// ESP32-S3 PIE (128-bit SIMD) kernels - not available on other Xtensa cores
+#if defined(__XTENSA__) && defined(__has_include)
+    #if __has_include(<sdkconfig.h>)
+        #include <sdkconfig.h>
+    #endif
+#endif
+#if defined(__XTENSA__) && defined(CONFIG_IDF_TARGET_ESP32S3)
+    #define LUT_USE_PIE 1
+#else
+    #define LUT_USE_PIE 0
+#endif
+
 // Compiler optimization hints
 #ifndef IRAM_ATTR
     #define IRAM_ATTR __attribute__((section(".iram1")))
 #endif
 #define FORCEINLINE __inline__ __attribute__((always_inline))
+#define LUT_HOT __attribute__((hot))
 
-namespace lut {
+// Guaranteed alignment (bytes) of pixel buffers passed to the filters.
+// Define as 16 when frame buffers come from 16-byte aligned allocations;
+// the compiler then drops the runtime alignment checks.
+#ifndef LUT_PIXEL_ALIGN
+    #define LUT_PIXEL_ALIGN 2
+#endif
+""")
+    
+    if target == "wasm-simd":
+        content.append("""#ifdef __wasm_simd128__
+    #include <wasm_simd128.h>
+#endif
+""")
+    elif target == "x86-vnni":
+        content.append("""#ifdef __AVX2__
+    #include <immintrin.h>
+#endif
+""")
+    
+    content.append("""namespace lut {
 
 """)
     
@@ -393,6 +1334,11 @@ namespace lut {
     content.append(format_lut_array("GRAY_LUT_G", lut_g, "uint8_t"))
     content.append(format_lut_array("GRAY_LUT_B", lut_b, "uint8_t"))
     
+    # Grayscale LUTs indexed by RGB565 fields (used by filter_grayscale_lut)
+    gray_rb, gray_g = generate_grayscale_rgb565_lut()
+    content.append(format_lut_array("GRAY_RB_LUT", gray_rb, "uint16_t"))
+    content.append(format_lut_array("GRAY_G_LUT", gray_g, "uint16_t"))
+    
     if include_all:
         # Sepia LUTs
         sepia_luts = generate_sepia_lut()
@@ -408,7 +1354,7 @@ namespace lut {
         content.append(format_lut_array("GAMMA_LUT_INV", inv_gamma_lut, "uint8_t"))
         
         # Vignette factors
-        vignette_lut = generate_vignette_factor_lut(128)
+        vignette_lut = generate_vignette_factor_lut(256)
         content.append(format_lut_array("VIGNETTE_LUT", vignette_lut, "uint8_t"))
         
         # RGB565 packing LUTs
@@ -420,7 +1366,51 @@ namespace lut {
     # SIMD filter functions
     content.append(generate_simd_filter_code("grayscale"))
     if include_all:
-        content.append(generate_simd_filter_code("sepia"))
+        if target == "wasm-simd":
+            content.append("#ifdef __wasm_simd128__")
+            content.append(generate_wasm_simd_filter_code("sepia"))
+            content.append("#else")
+        elif target == "x86-vnni":
+            content.append("#ifdef __AVX2__")
+            content.append(generate_x86_vnni_filter_code("sepia"))
+            content.append("#else")
+        content.append(generate_simd_filter_code("sepia", qformat))
+        if target == "wasm-simd":
+            content.append("#endif // __wasm_simd128__")
+        elif target == "x86-vnni":
+            content.append("#endif // __AVX2__")
+        content.append(generate_gamma_code())
+        content.append(generate_isqrt_code())
+    
+    if include_all and (fat_lut or styles):
+        content.append(f"""
+// ============================================================
+// LARGE LUTS (128KB each) - opt in with -DPYFORGE_USE_FAT_LUT=1
+// ============================================================
+#ifndef PYFORGE_USE_FAT_LUT
+    #define PYFORGE_USE_FAT_LUT 0
+#endif
+
+#if PYFORGE_USE_FAT_LUT
+
+// 64K-entry tables are split into chunks: NAME[i >> SHIFT][i & MASK]
+static constexpr uint32_t LUT_CHUNK_SHIFT = {LUT_CHUNK_SHIFT};
+static constexpr uint32_t LUT_CHUNK_MASK = 0x{LUT_CHUNK_SIZE - 1:X};
+""")
+        if fat_lut:
+            content.append(format_lut_array("SEPIA_RGB565", generate_sepia_rgb565_lut(), "uint16_t",
+                                            chunk_size=LUT_CHUNK_SIZE))
+            content.append(generate_simd_filter_code("sepia_fused"))
+        
+        # Tiled 3D LUTs, one per style, all applied by apply_3dlut()
+        for style in styles:
+            lut_3d = generate_3dlut_tile(STYLE_TRANSFORMS[style])
+            content.append(format_lut_array(f"{style.upper()}_3DLUT", lut_3d, "uint16_t",
+                                            chunk_size=LUT_CHUNK_SIZE))
+        if styles:
+            content.append(generate_simd_filter_code("3dlut"))
+        
+        content.append("#endif // PYFORGE_USE_FAT_LUT")
     
     # Namespace close
     content.append("""
@@ -428,12 +1418,14 @@ namespace lut {
 """)
     
     # Write file
-    os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
-    with open(output_path, 'w') as f:
-        f.write("\n".join(content))
+    out_path = Path(output_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text("\n".join(content))
     
     print(f"[convert.py] Generated: {output_path}")
-    print(f"[convert.py] LUTs included: grayscale" + (", sepia, gamma, vignette, rgb565" if include_all else ""))
+    print(f"[convert.py] LUTs included: grayscale" + (", sepia, gamma, vignette, rgb565" if include_all else "")
+          + (", sepia_rgb565" if include_all and fat_lut else "")
+          + "".join(f", {style}_3dlut" for style in styles if include_all))
 
 
 def generate_filter_coefficients() -> str:
@@ -447,12 +1439,14 @@ def generate_filter_coefficients() -> str:
     
     code.append("""
 // ============================================================
-// FIXED-POINT COEFFICIENTS (Q8 Format)
+// FIXED-POINT COEFFICIENTS (Q8 / Q15 Format)
 // ============================================================
 // HARDWARE: Integer multiply + right-shift replaces float multiply
 // 
 // Q8 format: value * 256, then >> 8 after multiply
 // Example: 0.299 * 256 = 76.544 ≈ 77
+// Q15 format: value * 32768, then (+ 0x4000) >> 15 after multiply
+// Example: 0.299 * 32768 = 9797.6 ≈ 9798
 // ============================================================
 
 namespace coef {
@@ -466,6 +1460,14 @@ namespace coef {
     code.append(f"static constexpr uint8_t LUMA_B_Q8 = {int(LUMA_B * Q8_SCALE + 0.5)};  // {LUMA_B:.3f} * 256")
     code.append("")
     
+    # Normalized multipliers: y = (x * M0) >> SHIFT, M0 in [16384, 32768)
+    code.append("// Grayscale luminance (normalized: Y_c = (c * M0) >> SHIFT)")
+    for name, val in (("R", LUMA_R), ("G", LUMA_G), ("B", LUMA_B)):
+        m0, n = normalize_multiplier(val, 15)
+        code.append(f"static constexpr int16_t LUMA_{name}_M0 = {m0};  // {val:.3f} * 2^{n}")
+        code.append(f"static constexpr uint8_t LUMA_{name}_SHIFT = {n};")
+    code.append("")
+    
     # Sepia matrix coefficients
     code.append("// Sepia transformation matrix (Q8)")
     for i, row in enumerate(SEPIA_MATRIX):
@@ -476,6 +1478,22 @@ namespace coef {
             code.append(f"static constexpr uint8_t SEPIA_{row_name}{col_name}_Q8 = {q8_val};  // {val:.3f} * 256")
     code.append("")
     
+    # Q15: same multiply cost, 7 more fractional bits. Round with +0x4000:
+    # (c * x + 0x4000) >> 15
+    code.append("// Grayscale luminance (Q15)")
+    code.append(f"static constexpr int16_t LUMA_R_Q15 = {to_q15(LUMA_R)};  // {LUMA_R:.3f} * 32768")
+    code.append(f"static constexpr int16_t LUMA_G_Q15 = {to_q15(LUMA_G)};  // {LUMA_G:.3f} * 32768")
+    code.append(f"static constexpr int16_t LUMA_B_Q15 = {to_q15(LUMA_B)};  // {LUMA_B:.3f} * 32768")
+    code.append("")
+    
+    code.append("// Sepia transformation matrix (Q15)")
+    for i, row in enumerate(SEPIA_MATRIX):
+        row_name = ['R', 'G', 'B'][i]
+        for j, val in enumerate(row):
+            col_name = ['R', 'G', 'B'][j]
+            code.append(f"static constexpr int16_t SEPIA_{row_name}{col_name}_Q15 = {to_q15(val)};  // {val:.3f} * 32768")
+    code.append("")
+    
     # Contrast/brightness constants
     code.append(f"// Vintage filter constants")
     code.append(f"static constexpr uint8_t VINTAGE_WARMTH = {VINTAGE_WARMTH};")
@@ -504,6 +1522,11 @@ def main():
         epilog="""
 Examples:
   python convert.py --all --output src/luts/lut_tables.hpp
+  python convert.py --all --fat-lut --output src/luts/lut_tables.hpp
+  python convert.py --all --qformat q15 --output src/luts/lut_tables.hpp
+  python convert.py --all --3dlut vintage --3dlut cool --output src/luts/lut_tables.hpp
+  python convert.py --all --target wasm-simd --output src/luts/lut_tables.hpp
+  python convert.py --all --target x86-vnni --output src/luts/lut_tables.hpp
   python convert.py --filter grayscale --output lut_gray.hpp
   python convert.py --coefficients --output coefficients.hpp
         """
@@ -517,26 +1540,40 @@ Examples:
                         help="Generate fixed-point coefficients only")
     parser.add_argument("--output", "-o", default="lut_tables.hpp",
                         help="Output file path")
+    parser.add_argument("--fat-lut", action="store_true",
+                        help="Also emit the 128KB fused RGB565 sepia LUT")
+    parser.add_argument("--3dlut", dest="styles", action="append", default=[],
+                        choices=sorted(STYLE_TRANSFORMS),
+                        help="Also emit a 128KB tiled 3D LUT for a color style (repeatable)")
+    parser.add_argument("--qformat", choices=QFORMATS, default="q8",
+                        help="Fixed-point format for the sepia filter (default: q8 LUTs)")
+    parser.add_argument("--target", choices=TARGETS, default="esp32",
+                        help="Also emit a sepia variant for this target (default: esp32 only)")
     
     args = parser.parse_args()
     
     if args.coefficients:
         # Generate just coefficients
         content = generate_filter_coefficients()
-        with open(args.output, 'w') as f:
-            f.write("#pragma once\n")
-            f.write("// Generated by convert.py\n\n")
-            f.write('#include <stdint.h>\n\n')
-            f.write(content)
+        Path(args.output).write_text(
+            "#pragma once\n"
+            "// Generated by convert.py\n\n"
+            "#include <stdint.h>\n\n"
+            + content
+        )
         print(f"[convert.py] Generated coefficients: {args.output}")
     
     elif args.all or not args.filter:
         # Generate complete header with all LUTs
-        generate_header_file(args.output, include_all=True)
+        generate_header_file(args.output, include_all=True, fat_lut=args.fat_lut,
+                             qformat=args.qformat, styles=args.styles,
+                             target=args.target)
     
     elif args.filter:
         # Generate specific filter
-        generate_header_file(args.output, include_all=(args.filter != "grayscale"))
+        generate_header_file(args.output, include_all=(args.filter != "grayscale"),
+                             fat_lut=args.fat_lut, qformat=args.qformat,
+                             styles=args.styles, target=args.target)
     
     print("[convert.py] Done!")
 
@@ -0,0 +1,310 @@
+"""
+PyForge Pattern Matchers
+========================
+
+AST recognizers for common pixel idioms in Python mods. Each matcher
+takes an AST node and returns the data needed to emit an optimized
+C++ replacement, or None if the node does not match.
+
+Recognized patterns:
+1. frame.buffer ^= 0xFF               -> bulk buffer XOR
+2. Per-pixel loop with set_pixel(x, y, 255 - r, 255 - g, 255 - b)
+                                      -> bulk buffer XOR (invert)
+3. a*r + b*g + c*b (float constants,  -> Q15 rounding multiply-accumulate
+   channel operands, integer result)
+"""
+
+import ast
+import math
+from typing import Callable, List, Optional, Set, Tuple
+
+# Q15: 15 fractional bits, rounding bias of 0.5 LSB added before the shift
+Q15_SHIFT = 15
+Q15_ONE = 1 << Q15_SHIFT
+Q15_ROUND = 1 << (Q15_SHIFT - 1)  # 0x4000
+INT32_MAX = (1 << 31) - 1
+
+# NumPy scalar casts -> C++ types (np.uint8(0xFF) -> (uint8_t)0xFF)
+NUMPY_CASTS = {
+    'uint8': 'uint8_t',
+    'int8': 'int8_t',
+    'uint16': 'uint16_t',
+    'int16': 'int16_t',
+    'uint32': 'uint32_t',
+    'int32': 'int32_t',
+}
+NUMPY_ALIASES = {'np', 'numpy'}
+
+# Channel-width annotations -> largest magnitude they hold. Only these
+# (and get_pixel channels) can be Q15 MAC operands: the int32 MAC must
+# not overflow.
+CHANNEL_TYPES = {
+    'uint8': 255,
+    'int8': 128,
+    'uint16': 65535,
+    'int16': 32768,
+}
+
+# Annotations of integer results (the MAC result is rounded to an integer)
+INTEGER_TYPES = {'int'} | set(NUMPY_CASTS)
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+def numpy_cast_type(node) -> Optional[str]:
+    """Return the C++ type if node is a NumPy scalar cast like np.uint8(x)"""
+    if (isinstance(node, ast.Call) and len(node.args) == 1
+            and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id in NUMPY_ALIASES):
+        return NUMPY_CASTS.get(node.func.attr)
+    return None
+
+
+def unwrap_numpy_cast(node):
+    """np.uint8(x) -> x, anything else unchanged"""
+    if numpy_cast_type(node):
+        return node.args[0]
+    return node
+
+
+def int_constant(node) -> Optional[int]:
+    """Return the value of an integer constant (through NumPy casts)"""
+    node = unwrap_numpy_cast(node)
+    if isinstance(node, ast.Constant) and type(node.value) is int:
+        return node.value
+    return None
+
+
+def to_q15(value: float) -> int:
+    """Quantize a coefficient to Q15 with round-half-up"""
+    return int(math.floor(value * Q15_ONE + 0.5))
+
+
+# ============================================================
+# BULK BUFFER XOR
+# ============================================================
+
+def match_buffer_xor(node: ast.AugAssign) -> Optional[Tuple[ast.expr, int]]:
+    """
+    Recognize `<frame>.buffer ^= <const>`.
+
+    Returns:
+        (frame expression, byte value) or None
+    """
+    target = node.target
+    if not (isinstance(target, ast.Attribute) and target.attr == "buffer"):
+        return None
+    if not isinstance(node.op, ast.BitXor):
+        return None
+
+    value = int_constant(node.value)
+    if value is None:
+        return None
+
+    return target.value, value & 0xFF
+
+
+# ============================================================
+# PER-PIXEL INVERT LOOP
+# ============================================================
+
+def _range_over(node: ast.For, attr: str) -> Optional[str]:
+    """Match `for <v> in range(<frame>.<attr>)`, return the frame name"""
+    it = node.iter
+    if not (isinstance(it, ast.Call) and isinstance(it.func, ast.Name)
+            and it.func.id == "range" and len(it.args) == 1):
+        return None
+    arg = it.args[0]
+    if (isinstance(arg, ast.Attribute) and arg.attr == attr
+            and isinstance(arg.value, ast.Name)):
+        return arg.value.id
+    return None
+
+
+def _is_invert_of(node, name: str) -> bool:
+    """Match `255 - <name>`"""
+    return (isinstance(node, ast.BinOp) and isinstance(node.op, ast.Sub)
+            and int_constant(node.left) == 255
+            and isinstance(node.right, ast.Name) and node.right.id == name)
+
+
+def match_invert_loop(node: ast.For) -> Optional[str]:
+    """
+    Recognize the per-pixel invert loop:
+
+        for y in range(frame.height):
+            for x in range(frame.width):
+                r, g, b = frame.get_pixel(x, y)
+                frame.set_pixel(x, y, 255 - r, 255 - g, 255 - b)
+
+    255 - v is ~v for 8-bit channels, and inverting every channel of an
+    RGB565 pixel is inverting all of its bits, so the whole loop is one
+    XOR of the frame buffer with 0xFF.
+
+    Returns:
+        Frame variable name or None
+    """
+    frame = _range_over(node, "height")
+    if frame is None or len(node.body) != 1 or not isinstance(node.body[0], ast.For):
+        return None
+
+    inner = node.body[0]
+    if _range_over(inner, "width") != frame or len(inner.body) != 2:
+        return None
+    if not (isinstance(node.target, ast.Name) and isinstance(inner.target, ast.Name)):
+        return None
+    y, x = node.target.id, inner.target.id
+
+    get_stmt, set_stmt = inner.body
+
+    # r, g, b = frame.get_pixel(x, y)
+    if not (isinstance(get_stmt, ast.Assign) and len(get_stmt.targets) == 1):
+        return None
+    names = get_stmt.targets[0]
+    call = get_stmt.value
+    if not (isinstance(names, ast.Tuple) and len(names.elts) == 3
+            and all(isinstance(e, ast.Name) for e in names.elts)):
+        return None
+    if not _is_frame_call(call, frame, "get_pixel", [x, y]):
+        return None
+
+    # frame.set_pixel(x, y, 255 - r, 255 - g, 255 - b)
+    if not isinstance(set_stmt, ast.Expr):
+        return None
+    call = set_stmt.value
+    if not _is_frame_call(call, frame, "set_pixel", [x, y], extra=3):
+        return None
+    if not all(_is_invert_of(arg, n.id) for arg, n in zip(call.args[2:], names.elts)):
+        return None
+
+    return frame
+
+
+def _is_frame_call(call, frame: str, method: str, coords: List[str], extra: int = 0) -> bool:
+    """Match `<frame>.<method>(x, y, ...)` with `extra` trailing args"""
+    if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)
+            and call.func.attr == method and isinstance(call.func.value, ast.Name)
+            and call.func.value.id == frame and len(call.args) == 2 + extra):
+        return False
+    return all(isinstance(a, ast.Name) and a.id == c for a, c in zip(call.args, coords))
+
+
+# ============================================================
+# LINEAR COMBINATION -> Q15
+# ============================================================
+
+def _flatten_sum(node) -> List[ast.expr]:
+    """a + b + c -> [a, b, c]"""
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        return _flatten_sum(node.left) + _flatten_sum(node.right)
+    return [node]
+
+
+def _float_term(node) -> Optional[Tuple[float, ast.expr]]:
+    """Match `c * x` or `x * c` with a float constant c"""
+    if not (isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mult)):
+        return None
+    for const, operand in ((node.left, node.right), (node.right, node.left)):
+        if isinstance(const, ast.Constant) and type(const.value) is float:
+            return const.value, operand
+    return None
+
+
+def match_linear_combination(node, operand_bound: Callable[[ast.expr], Optional[int]]
+                             ) -> Optional[List[Tuple[float, ast.expr]]]:
+    """
+    Recognize a weighted sum of at least two terms with float weights,
+    e.g. `0.299 * r + 0.587 * g + 0.114 * b`.
+
+    Only weights in [0, 1) match, so every Q15 coefficient fits int16
+    (the range _mm_mulhrs_epi16 / EE.VMULAS.S16 operate on). Every
+    operand must have a known integer bound, and the whole MAC must fit
+    int32. The caller only asks where the result is used as an integer:
+    the rewrite rounds, which changes any float result.
+
+    Args:
+        node: Expression to match
+        operand_bound: Largest magnitude an operand can hold, or None
+            if it is not a known integer
+
+    Returns:
+        List of (weight, operand) or None
+    """
+    parts = _flatten_sum(node)
+    if len(parts) < 2:
+        return None
+
+    terms = []
+    worst = Q15_ROUND
+    for part in parts:
+        term = _float_term(part)
+        if term is None or not 0.0 <= term[0] < 1.0:
+            return None
+        bound = operand_bound(term[1])
+        if bound is None:
+            return None
+        worst += to_q15(term[0]) * bound
+        terms.append(term)
+
+    if worst > INT32_MAX:
+        return None
+
+    return terms
+
+
+def channel_locals(func: ast.FunctionDef, frames: Set[str]) -> Set[str]:
+    """
+    Names in func that only ever hold pixel channels: assigned by plain
+    `name = ...` and read only as channel arguments of
+    `<frame>.set_pixel(x, y, r, g, b)`.
+
+    A weighted sum assigned to such a name is consumed as an integer,
+    so it may use the Q15 MAC.
+    """
+    assigned, other = set(), set()
+    channel_loads = set()
+
+    for node in ast.walk(func):
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    assigned.add(target.id)
+        elif (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and node.func.attr == "set_pixel" and isinstance(node.func.value, ast.Name)
+                and node.func.value.id in frames):
+            channel_loads.update(id(arg) for arg in node.args[2:] if isinstance(arg, ast.Name))
+
+    for node in ast.walk(func):
+        if not isinstance(node, ast.Name):
+            continue
+        if isinstance(node.ctx, ast.Load) and id(node) not in channel_loads:
+            other.add(node.id)
+
+    # Annotated, augmented, tuple or loop targets are not plain channel locals
+    for node in ast.walk(func):
+        if isinstance(node, (ast.AnnAssign, ast.AugAssign, ast.For)):
+            if isinstance(node.target, ast.Name):
+                other.add(node.target.id)
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if not isinstance(target, ast.Name):
+                    other.update(n.id for n in ast.walk(target) if isinstance(n, ast.Name))
+    other.update(arg.arg for arg in func.args.args)
+
+    return assigned - other
+
+
+def emit_q15_mac(terms: List[Tuple[float, ast.expr]], visit: Callable[[ast.expr], str]) -> str:
+    """
+    Emit an integer Q15 multiply-accumulate with a single rounding step:
+
+        (C0 * x0 + C1 * x1 + ... + 0x4000) >> 15
+
+    The 0x4000 bias rounds to nearest, matching the saturating-rounding
+    Q15 multiply contract (pmulhrsw / vqrdmulh / q15mulr).
+    """
+    products = " + ".join(f"{to_q15(w)} * {visit(x)}" for w, x in terms)
+    return f"(({products} + 0x{Q15_ROUND:X}) >> {Q15_SHIFT})"
@@ -7,8 +7,12 @@ Automatically transpiles Python mods to C++ before compilation.
 Place in platformio.ini: extra_scripts = pre:tools/pyforge/prebuild.py
 """
 
+import hashlib
+import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
 # Import SCons env first - required for PlatformIO extra_scripts
@@ -26,6 +30,57 @@ sys.path.insert(0, str(script_dir))
 
 from pyforge import compile_file
 
+# Source hashes of the last successful compile, keyed by mod file name
+CACHE_NAME = ".pyforge_cache.json"
+
+# Transpiler sources: a change to any of them invalidates every mod
+TRANSPILER_SOURCES = ("pyforge.py", "patterns.py")
+
+# ProcessPoolExecutor rejects more than 61 workers on Windows
+MAX_WORKERS = 61
+
+def transpiler_hash() -> str:
+    """Hash of the transpiler sources, part of every mod's cache key"""
+    digest = hashlib.sha1()
+    for name in TRANSPILER_SOURCES:
+        digest.update((script_dir / name).read_bytes())
+    return digest.hexdigest()
+
+def load_cache(cache_path: Path) -> dict:
+    """Read the hash cache, treating a missing or corrupt file as empty"""
+    try:
+        return json.loads(cache_path.read_text() or "{}")
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache_path: Path, cache: dict):
+    """Write the hash cache atomically (temp file + rename)"""
+    tmp_path = cache_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(cache, indent=2, sort_keys=True))
+    os.replace(tmp_path, cache_path)
+
+def compile_all(jobs: dict) -> dict:
+    """
+    Transpile {py_file: cpp_file} in parallel.
+    Returns {py_file: success}. Falls back to serial compilation if a
+    process pool cannot be started in this environment.
+    """
+    if len(jobs) == 1:
+        return {py: compile_file(str(py), str(cpp)) for py, cpp in jobs.items()}
+    
+    try:
+        results = {}
+        workers = min(len(jobs), os.cpu_count() or 1, MAX_WORKERS)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(compile_file, str(py), str(cpp)): py
+                       for py, cpp in jobs.items()}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        return results
+    except (BrokenProcessPool, OSError) as e:
+        print(f"[PyForge] Process pool unavailable ({e}), compiling serially")
+        return {py: compile_file(str(py), str(cpp)) for py, cpp in jobs.items()}
+
 def before_build(source, target, env):
     """Called before build starts"""
     project_dir = Path(env['PROJECT_DIR'])
@@ -48,17 +103,37 @@ def before_build(source, target, env):
     # Create output directory
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Compile each Python file
+    # Check which files need recompilation. Content hashes, not mtimes:
+    # git checkouts rewrite timestamps without changing the source.
+    # The key covers the transpiler too, so its changes regenerate mods.
+    cache_path = project_dir / CACHE_NAME
+    cache = load_cache(cache_path)
+    tool_hash = transpiler_hash()
+    jobs = {}
+    hashes = {}
+    
     for py_file in py_files:
         cpp_file = output_dir / (py_file.stem + ".cpp")
+        src_hash = hashlib.sha1(tool_hash.encode() + py_file.read_bytes()).hexdigest()
         
-        # Check if recompilation needed
-        if cpp_file.exists():
-            if cpp_file.stat().st_mtime > py_file.stat().st_mtime:
-                print(f"[PyForge] Skipping {py_file.name} (up to date)")
-                continue
+        if cache.get(py_file.name) == src_hash and cpp_file.exists():
+            print(f"[PyForge] Skipping {py_file.name} (up to date)")
+            continue
         
-        compile_file(str(py_file), str(cpp_file))
+        jobs[py_file] = cpp_file
+        hashes[py_file] = src_hash
+    
+    if not jobs:
+        return
+    
+    # Compile stale files in parallel, then record what succeeded
+    for py_file, success in compile_all(jobs).items():
+        if success:
+            cache[py_file.name] = hashes[py_file]
+        else:
+            cache.pop(py_file.name, None)
+    
+    save_cache(cache_path, cache)
 
 # Register pre-build action
 env.AddPreAction("buildprog", before_build)
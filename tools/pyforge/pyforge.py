@@ -17,6 +17,8 @@ import argparse
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
+import patterns
+
 # Type mapping: Python -> C++
 TYPE_MAP = {
     'int': 'int32_t',
@@ -30,6 +32,12 @@ TYPE_MAP = {
     'None': 'void',
 }
 
+# Attribute mapping: Python Frame API -> CamFrame fields
+# (applied only to names annotated as Frame)
+ATTR_MAP = {
+    'buffer': 'data',
+}
+
 class PyForgeCompiler(ast.NodeVisitor):
     """AST visitor that generates C++ code from Python"""
     
@@ -40,6 +48,9 @@ class PyForgeCompiler(ast.NodeVisitor):
         self.class_name: Optional[str] = None
         self.in_class = False
         self.local_vars: Dict[str, str] = {}
+        self.var_types: Dict[str, str] = {}  # name -> Python annotation
+        self.channel_locals: Set[str] = set()  # locals only fed to set_pixel
+        self.returns_integer = False
         
     def indent(self) -> str:
         return "    " * self.indent_level
@@ -50,6 +61,41 @@ class PyForgeCompiler(ast.NodeVisitor):
     def emit_raw(self, code: str):
         self.output.append(code)
     
+    def annotate(self, name: str, annotation):
+        """Remember the Python type of a name (args and annotated locals)"""
+        if isinstance(annotation, ast.Name):
+            self.var_types[name] = annotation.id
+        elif isinstance(annotation, ast.Constant):
+            self.var_types[name] = str(annotation.value)
+    
+    def is_frame(self, node) -> bool:
+        """True if node is a name annotated as Frame"""
+        return isinstance(node, ast.Name) and self.var_types.get(node.id) == "Frame"
+    
+    def is_integer_type(self, annotation) -> bool:
+        """True if annotation names an integer type (int, uint8, ...)"""
+        return isinstance(annotation, ast.Name) and annotation.id in patterns.INTEGER_TYPES
+    
+    def operand_bound(self, node) -> Optional[int]:
+        """Largest magnitude of an integer constant or channel-width name"""
+        value = patterns.int_constant(node)
+        if value is not None:
+            return abs(value)
+        if isinstance(node, ast.Name):
+            return patterns.CHANNEL_TYPES.get(self.var_types.get(node.id))
+        return None
+    
+    def visit_int_expr(self, node) -> str:
+        """
+        Visit an expression whose value is consumed as an integer.
+        Float-weighted channel sums (a*r + b*g + c*b) become an integer
+        Q15 MAC here; anywhere else they stay float expressions.
+        """
+        terms = patterns.match_linear_combination(node, self.operand_bound)
+        if terms:
+            return patterns.emit_q15_mac(terms, self.visit_expr)
+        return self.visit_expr(node)
+    
     def get_type(self, annotation) -> str:
         """Convert Python type annotation to C++ type"""
         if annotation is None:
@@ -135,15 +181,21 @@ class PyForgeCompiler(ast.NodeVisitor):
         # Return type
         return_type = self.get_type(node.returns)
         
-        # Parameters
+        # Parameters (their types are scoped to this function)
+        outer = self.var_types, self.channel_locals, self.returns_integer
+        self.var_types = dict(self.var_types)
+        self.returns_integer = self.is_integer_type(node.returns)
         params = []
         for arg in node.args.args:
             if arg.arg == "self":
                 continue
             param_type = self.get_type(arg.annotation)
             params.append(f"{param_type} {arg.arg}")
+            self.annotate(arg.arg, arg.annotation)
         
         param_str = ", ".join(params)
+        frames = {name for name, t in self.var_types.items() if t == "Frame"}
+        self.channel_locals = patterns.channel_locals(node, frames)
         
         # Special handling for 'process' method in filters
         override = " override" if is_method and node.name == "process" else ""
@@ -158,8 +210,15 @@ class PyForgeCompiler(ast.NodeVisitor):
         self.indent_level -= 1
         self.emit("}")
         self.emit_raw("")
+        self.var_types, self.channel_locals, self.returns_integer = outer
     
     def visit_For(self, node: ast.For):
+        # Per-pixel invert loop -> single bulk XOR over the frame buffer
+        frame = patterns.match_invert_loop(node)
+        if frame and self.var_types.get(frame) == "Frame":
+            self.emit_buffer_xor(frame, 0xFF)
+            return
+        
         # Handle range() loops
         if isinstance(node.iter, ast.Call) and isinstance(node.iter.func, ast.Name):
             if node.iter.func.id == "range":
@@ -223,13 +282,25 @@ class PyForgeCompiler(ast.NodeVisitor):
     
     def visit_Return(self, node: ast.Return):
         if node.value:
-            self.emit(f"return {self.visit_expr(node.value)};")
+            value = self.visit_int_expr(node.value) if self.returns_integer else self.visit_expr(node.value)
+            self.emit(f"return {value};")
         else:
             self.emit("return;")
     
     def visit_Assign(self, node: ast.Assign):
         target = self.visit_expr(node.targets[0])
-        value = self.visit_expr(node.value)
+        if isinstance(node.targets[0], ast.Name) and node.targets[0].id in self.channel_locals:
+            value = self.visit_int_expr(node.value)
+        else:
+            value = self.visit_expr(node.value)
+        
+        # r, g, b = frame.get_pixel(x, y): 8-bit integer channels
+        if (isinstance(node.targets[0], ast.Tuple) and isinstance(node.value, ast.Call)
+                and isinstance(node.value.func, ast.Attribute)
+                and node.value.func.attr == "get_pixel" and self.is_frame(node.value.func.value)):
+            for elt in node.targets[0].elts:
+                if isinstance(elt, ast.Name):
+                    self.var_types[elt.id] = "uint8"
         
         # Check if this is a new variable
         if isinstance(node.targets[0], ast.Name):
@@ -244,13 +315,33 @@ class PyForgeCompiler(ast.NodeVisitor):
     def visit_AnnAssign(self, node: ast.AnnAssign):
         var_type = self.get_type(node.annotation)
         target = self.visit_expr(node.target)
+        if isinstance(node.target, ast.Name):
+            self.annotate(node.target.id, node.annotation)
         
         if node.value:
-            value = self.visit_expr(node.value)
+            if self.is_integer_type(node.annotation):
+                value = self.visit_int_expr(node.value)
+            else:
+                value = self.visit_expr(node.value)
             self.emit(f"{var_type} {target} = {value};")
         else:
             self.emit(f"{var_type} {target};")
     
+    def visit_AugAssign(self, node: ast.AugAssign):
+        # Bulk buffer idiom: frame.buffer ^= 0xFF -> one vectorized pass
+        match = patterns.match_buffer_xor(node)
+        if match and self.is_frame(match[0]):
+            frame, value = match
+            self.emit_buffer_xor(self.visit_expr(frame), value)
+            return
+        
+        target = self.visit_expr(node.target)
+        value = self.visit_expr(node.value)
+        self.emit(f"{target} {self.binop_to_str(node.op)}= {value};")
+    
+    def emit_buffer_xor(self, frame: str, value: int):
+        self.emit(f"pyforge::buffer_xor({frame}.data, {frame}.len, 0x{value:02X});")
+    
     def visit_Expr(self, node: ast.Expr):
         expr = self.visit_expr(node.value)
         if expr:
@@ -295,13 +386,21 @@ class PyForgeCompiler(ast.NodeVisitor):
             return operand
         
         if isinstance(node, ast.Call):
+            cast = patterns.numpy_cast_type(node)
+            if cast:
+                return f"(({cast}){self.visit_expr(node.args[0])})"
             func = self.visit_expr(node.func)
-            args = ", ".join(self.visit_expr(a) for a in node.args)
-            return f"{func}({args})"
+            args = [self.visit_expr(a) for a in node.args]
+            # frame.set_pixel(x, y, r, g, b): channels are integers
+            if (isinstance(node.func, ast.Attribute) and node.func.attr == "set_pixel"
+                    and self.is_frame(node.func.value)):
+                args[2:] = [self.visit_int_expr(a) for a in node.args[2:]]
+            return f"{func}({', '.join(args)})"
         
         if isinstance(node, ast.Attribute):
             value = self.visit_expr(node.value)
-            return f"{value}.{node.attr}"
+            attr = ATTR_MAP.get(node.attr, node.attr) if self.is_frame(node.value) else node.attr
+            return f"{value}.{attr}"
         
         if isinstance(node, ast.Subscript):
             value = self.visit_expr(node.value)
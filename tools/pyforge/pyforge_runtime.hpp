@@ -14,6 +14,7 @@
  */
 
 #include <Arduino.h>
+#include <string.h>
 
 // ============================================================
 // PSRAM Allocation Helpers for Mods
@@ -176,6 +177,53 @@ inline T max(T a, T b) { return a > b ? a : b; }
 template<typename T>
 inline T abs(T a) { return a < 0 ? -a : a; }
 
+// ============================================================
+// Bulk Buffer Operations
+// ============================================================
+/**
+ * XOR every byte of a buffer with a constant (frame.buffer ^= value)
+ * HARDWARE: 4 bytes per 32-bit XOR; 16 bytes per PIE EE.XORQ on ESP32-S3
+ */
+// XOR one 32-bit word in place; memcpy keeps the byte buffer free of
+// strict-aliasing UB and still compiles to a single L32I/S32I pair
+inline void xor_word(uint8_t* p, uint32_t mask) {
+    uint32_t w;
+    memcpy(&w, p, sizeof w);
+    w ^= mask;
+    memcpy(p, &w, sizeof w);
+}
+
+inline void IRAM_ATTR buffer_xor(uint8_t* data, size_t len, uint8_t value) {
+    uint8_t* p = data;
+    uint8_t* const end = data + len;
+    const uint32_t mask = value * 0x01010101u;
+    
+    // Head: single bytes up to word alignment
+    while (p < end && ((uintptr_t)p & 3)) *p++ ^= value;
+    
+#ifdef CONFIG_IDF_TARGET_ESP32S3
+    // Words up to 16-byte alignment, then 128-bit vectors
+    while (p + 4 <= end && ((uintptr_t)p & 15)) { xor_word(p, mask); p += 4; }
+    while (p + 16 <= end) {
+        __asm__ __volatile__ (
+            "ee.vldbc.8     q1, %[v]        \n"
+            "ee.vld.128.ip  q0, %[p], 0     \n"
+            "ee.xorq        q0, q0, q1      \n"
+            "ee.vst.128.ip  q0, %[p], 16    \n"
+            : [p] "+r" (p)
+            : [v] "r" (&value)
+            : "memory"
+        );
+    }
+#endif
+    
+    // Body: whole words
+    while (p + 4 <= end) { xor_word(p, mask); p += 4; }
+    
+    // Tail: remaining bytes
+    while (p < end) *p++ ^= value;
+}
+
 // ============================================================
 // Tuple Support
 // ============================================================